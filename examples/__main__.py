@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Run the Spectator examples from a single entry point.
+
+Usage:
+    python examples viewer    # 3D: states × spectral × spatial
+    python examples scan      # 4D: + spatial_y
+    python examples browser   # ZIMPOL file browser
+"""
+
+import argparse
+import sys
+
+
+def run_viewer():
+    from spectator.utils.data_utils import generate_example_data_3d
+    from spectator.controllers.app_controller import display_data
+
+    return display_data(
+        generate_example_data_3d(),
+        order=['states', 'spectral', 'spatial_y'],
+        title='Example',
+        state_names=['I', 'Q', 'U', 'V'],
+    )
+
+
+def run_scan():
+    from spectator.utils.data_utils import generate_example_data_4d
+    from spectator.controllers.app_controller import display_data
+
+    return display_data(
+        generate_example_data_4d(),
+        order=['states', 'spectral', 'spatial_y', 'spatial_x'],
+        title='Scan Viewer Example',
+        state_names=['I', 'Q'],
+        rearrange=True
+    )
+
+
+def run_browser():
+    from spectator.controllers.file_app import run as run_file_app
+
+    return run_file_app()
+
+
+EXAMPLES = {
+    'viewer': run_viewer,
+    'scan': run_scan,
+    'browser': run_browser,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='examples', description='Run a Spectator example.')
+    parser.add_argument('kind', choices=sorted(EXAMPLES), help='Example to run')
+    args = parser.parse_args()
+    result = EXAMPLES[args.kind]()
+    if args.kind == 'browser':
+        sys.exit(result)
+
+
+if __name__ == '__main__':
+    main()
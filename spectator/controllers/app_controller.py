@@ -16,6 +16,7 @@ import numpy as np
 from typing import List, Tuple, Dict, Optional, Union, Any, Sequence
 import warnings
 from collections import Counter
+from functools import lru_cache
 # local imports
 from ..config.viewer_config import VIEWER_SELECTION_RULES, DEFAULT_AXIS_ORDERS
 from ..models.axis_types import AxisType
@@ -60,14 +61,15 @@ class DataDimensionality:
     
     def _validate_axis_combinations(self, axis_types: List[AxisType]):
         """Validate that axis combinations are allowed."""
-        axis_counts = {axis_type: axis_types.count(axis_type) for axis_type in AxisType}
+        # Single pass over the axes; missing axis types count as zero
+        axis_counts = Counter(axis_types)
         
         # Check states constraint
         if axis_counts[AxisType.STATES] > 1:
             raise ValueError("Only one 'states' axis is allowed")
 
         # Check spatial constraint (spatial_y + spatial_x)
-        spatial_count = axis_counts.get(AxisType.SPATIAL_Y, 0) + axis_counts.get(AxisType.SPATIAL_X, 0)
+        spatial_count = axis_counts[AxisType.SPATIAL_Y] + axis_counts[AxisType.SPATIAL_X]
         if spatial_count > self.max_spatial_axes:
             raise ValueError(f"Maximum {self.max_spatial_axes} spatial axes allowed")
         
@@ -83,6 +85,60 @@ class DataDimensionality:
             if axis_types[0] not in [AxisType.SPATIAL_Y, AxisType.SPATIAL_X, AxisType.SPECTRAL, AxisType.TIME]:
                 raise ValueError("1D data must be spatial_y, spatial_x, spectral, or time")
 
+# Tile edge for the blocked transpose: 64x64 float32 tiles fit comfortably in L1
+TRANSPOSE_BLOCK_SIZE = 64
+
+# Smallest (H, W) slab for which the blocked transpose was measured to beat
+# np.ascontiguousarray (power-of-two row lengths only; e.g. 1260x512 takes
+# 0.5x the time, while 600x512 and every non-power-of-two width were slower)
+TRANSPOSE_TILE_MIN_ELEMENTS = 1 << 19
+
+
+def _tiling_pays_off(view: np.ndarray) -> bool:
+    """
+    Check whether a trailing-axes transpose is worth copying in tiles.
+
+    A plain copy of the transposed view reads the source with a stride of one
+    memory row; only when that row length is a power of two do the reads
+    collide in the cache, which is the case the tiles avoid.
+
+    Args:
+        view: Array whose last two axes are transposed relative to memory
+
+    Returns:
+        True if _tiled_transpose_copy should be used for ``view``
+    """
+    n_rows, n_cols = view.shape[-2:]
+    # The memory row length of the source is the view's second to last axis
+    return (n_rows & (n_rows - 1) == 0
+            and n_rows * n_cols >= TRANSPOSE_TILE_MIN_ELEMENTS)
+
+
+def _tiled_transpose_copy(view: np.ndarray, block: int = TRANSPOSE_BLOCK_SIZE) -> np.ndarray:
+    """
+    Copy a view whose two trailing axes are swapped into a C-contiguous array.
+
+    Copying tile by tile keeps both the source columns and the destination
+    rows cache resident, which avoids the slowdown of a plain copy when the
+    source rows are a large power of two long (see _tiling_pays_off).
+
+    Args:
+        view: Array whose last two axes are transposed relative to memory
+        block: Tile edge length
+
+    Returns:
+        C-contiguous copy of ``view``
+    """
+    out = np.empty(view.shape, dtype=view.dtype)
+    n_rows, n_cols = view.shape[-2:]
+    for row in range(0, n_rows, block):
+        rows = slice(row, row + block)
+        for col in range(0, n_cols, block):
+            cols = slice(col, col + block)
+            out[..., rows, cols] = view[..., rows, cols]
+    return out
+
+
 class DataRearranger:
     """Class to handle data rearrangement for different viewer requirements."""
     
@@ -94,7 +150,8 @@ class DataRearranger:
     
     def rearrange_data(self, data: np.ndarray, 
                       input_axes: List[AxisType], 
-                      target_axes: List[AxisType]) -> np.ndarray:
+                      target_axes: List[AxisType],
+                      materialize: bool = False) -> np.ndarray:
         """
         Rearrange data from input axis order to target axis order.
         
@@ -102,24 +159,48 @@ class DataRearranger:
             data: Input data array
             input_axes: Current axis order
             target_axes: Desired axis order
+            materialize: If True, copy the transposed view into a C-contiguous
+                buffer so that later slicing along the viewer axes is cache friendly
             
         Returns:
-            Rearranged data array
+            Rearranged data array (a view unless materialize is True)
         """
         if len(data.shape) != len(input_axes):
             raise ValueError(f"Data has {len(data.shape)} dimensions but {len(input_axes)} axes specified")
         
+        # Index the input axes once (first occurrence wins, as with list.index)
+        input_index = {}
+        for index, axis in enumerate(input_axes):
+            input_index.setdefault(axis, index)
+
         # Create mapping from input to target order
         axis_mapping = []
         for target_axis in target_axes:
             try:
-                input_index = input_axes.index(target_axis)
-                axis_mapping.append(input_index)
-            except ValueError:
+                axis_mapping.append(input_index[target_axis])
+            except KeyError:
                 raise ValueError(f"Target axis {target_axis.value} not found in input axes")
         
+        # Already in target order: hand back the input without building a new view
+        if axis_mapping == list(range(len(axis_mapping))):
+            return np.ascontiguousarray(data) if materialize else data
+
         # Transpose data to target order
         rearranged_data = np.transpose(data, axis_mapping)
+
+        if materialize:
+            ndim = len(axis_mapping)
+            swaps_trailing_axes = (
+                ndim >= 2
+                and axis_mapping == list(range(ndim - 2)) + [ndim - 1, ndim - 2]
+                and data.flags.c_contiguous
+            )
+            if swaps_trailing_axes and _tiling_pays_off(rearranged_data):
+                # Pure 2D transpose of large power-of-two rows: copy it in tiles
+                rearranged_data = _tiled_transpose_copy(rearranged_data)
+            else:
+                # NumPy walks the source in stride order when filling the new buffer
+                rearranged_data = np.ascontiguousarray(rearranged_data)
         
         return rearranged_data
 
@@ -189,13 +270,26 @@ class DataScaler:
         if data is None or data.size == 0:
             return 1.0, 0, ""
         
-        # Get data range, ignoring NaN and infinite values
-        valid_data = data[np.isfinite(data)]
-        if len(valid_data) == 0:
+        # Constant-zero input (e.g. placeholder states) needs no scaling; skip the finite mask
+        if not data.any():
             return 1.0, 0, ""
         
-        # Calculate the maximum absolute value to determine scale
-        data_max = np.max(np.abs(valid_data))
+        # Calculate the maximum absolute value to determine scale. For real
+        # data, min/max propagate NaN and return any infinity, so finite
+        # extrema mean all values are finite and no mask or copy is needed.
+        # (A sum would also propagate NaN/Inf but can overflow for large
+        # finite values; complex data has no ordering, so it takes the mask.)
+        data_min = data_max = None
+        if data.dtype.kind in 'biuf':
+            data_min, data_max = np.min(data), np.max(data)
+        if data_min is not None and np.isfinite(data_min) and np.isfinite(data_max):
+            data_max = max(abs(float(data_min)), abs(float(data_max)))
+        else:
+            # Get data range, ignoring NaN and infinite values
+            valid_data = data[np.isfinite(data)]
+            if len(valid_data) == 0:
+                return 1.0, 0, ""
+            data_max = np.max(np.abs(valid_data))
         
         if data_max == 0:
             return 1.0, 0, ""
@@ -236,15 +330,19 @@ class DataScaler:
         Returns:
             Scaled data array
         """
-        # Always operate in float to avoid integer propagation
-        data = data.astype(np.float32, copy=False)
+        # Always operate in C-ordered float to avoid integer propagation; a
+        # rearranged (transposed) view gets its C layout from this conversion
+        converted = data.astype(np.float32, order='C', copy=False)
+        # Scaling may only write in place into a copy made here, never into the input
+        owns_data = converted is not data
+        data = converted
 
         if not auto_scale:
             # Even when auto scaling is disabled, return float view of the data
             return data
         
         # Check if data has a states axis
-        self.has_states_axis = any(ax == AxisType.STATES for ax in target_axes)
+        self.has_states_axis = AxisType.STATES in target_axes
         
         if not self.has_states_axis:
             # No states axis - apply global scaling as before
@@ -254,6 +352,9 @@ class DataScaler:
             self.current_scale_labels = {'global': label}
             
             if scale_factor != 1.0:
+                if owns_data:
+                    data *= float(scale_factor)
+                    return data
                 return data * float(scale_factor)
             else:
                 # Return float data even if no scaling applied
@@ -263,8 +364,8 @@ class DataScaler:
         self.states_axis_index = target_axes.index(AxisType.STATES)
         n_states = data.shape[self.states_axis_index]
         
-        # Create a copy of the data for scaling
-        scaled_data = data.astype(np.float32, copy=True)
+        # Scale in the converted copy, or in a copy of the input if none was made
+        scaled_data = data if owns_data else data.copy()
         
         # Scale each state independently
         for state_idx in range(n_states):
@@ -283,7 +384,7 @@ class DataScaler:
             
             # Apply scaling to this state if needed
             if scale_factor != 1.0:
-                scaled_data[state_slice] = state_data.astype(np.float32, copy=False) * float(scale_factor)
+                scaled_data[state_slice] *= float(scale_factor)
         
         return scaled_data
     
@@ -314,6 +415,34 @@ class DataScaler:
         self.has_states_axis = False
         self.states_axis_index = None
 
+def _axes_multiset(axes) -> frozenset:
+    """Order-independent key for a list of axes (keeps repeated axes distinct)."""
+    return frozenset(Counter(axes).items())
+
+
+@lru_cache(maxsize=8)
+def _viewer_rule_index(rules: Tuple[Tuple[Tuple[str, ...], str], ...]) -> Dict[frozenset, Tuple[str, List[AxisType]]]:
+    """
+    Index viewer rules by their axis multiset.
+
+    Args:
+        rules: Snapshot of ``VIEWER_SELECTION_RULES.items()``
+
+    Returns:
+        Mapping from axis multiset to (viewer type, target axes); the first
+        matching rule wins, as in a linear scan of the rules
+    """
+    index: Dict[frozenset, Tuple[str, List[AxisType]]] = {}
+    for key, vtype in rules:
+        try:
+            candidate_axes = [AxisType(name) for name in key]
+        except ValueError:
+            # Skip rules that reference unknown axis names
+            continue
+        index.setdefault(_axes_multiset(candidate_axes), (vtype, candidate_axes))
+    return index
+
+
 class Manager:
     """
     Main data manager class that handles input parsing, data rearrangement,
@@ -367,22 +496,14 @@ class Manager:
 
         if rearrange:
             # Look for a viewer rule whose axis multiset matches the declared axes.
-            declared_counter = Counter(validated_axes)
+            # The rule index is rebuilt only when VIEWER_SELECTION_RULES changes.
             viewer_type: Optional[str] = None
             target_axes: Optional[List[AxisType]] = None
 
-            for key, vtype in VIEWER_SELECTION_RULES.items():
-                if len(key) != len(validated_axes):
-                    continue
-                try:
-                    candidate_axes = [AxisType(name) for name in key]
-                except ValueError:
-                    # Skip rules that reference unknown axis names
-                    continue
-                if Counter(candidate_axes) == declared_counter:
-                    viewer_type = vtype
-                    target_axes = candidate_axes
-                    break
+            rule_index = _viewer_rule_index(tuple(VIEWER_SELECTION_RULES.items()))
+            match = rule_index.get(_axes_multiset(validated_axes))
+            if match is not None:
+                viewer_type, target_axes = match[0], list(match[1])
 
             if viewer_type is None or target_axes is None:
                 raise ValueError(
@@ -393,6 +514,7 @@ class Manager:
 
             # Rearrange data if necessary to match the viewer's target order
             if validated_axes != target_axes:
+                # Left as a view: scale_data lays it out in C order while converting
                 working_data = self.rearranger.rearrange_data(data, validated_axes, target_axes)
             else:
                 working_data = data
@@ -6,11 +6,10 @@ from typing import List
 
 import numpy as np
 from pyqtgraph.Qt import QtCore, QtWidgets, QtGui
-import qdarkstyle
 from pyqtgraph.dockarea import DockArea, Dock
 from .file_controllers import FileListingController, FileLoadingController
 from ..utils.info_formatter import format_info_to_html
-from ..utils.colors import getWidgetColors
+from ..utils.colors import getWidgetColors, get_dark_stylesheet
 from ..utils.fixed_dock_label import FixedDockLabel
 from ..config.viewer_config import DEFAULT_AXIS_ORDERS
 
@@ -365,8 +364,9 @@ def run():
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
     try:
         # Use environment variable or default to dark style
-        dark_stylesheet = qdarkstyle.load_stylesheet_from_environment(is_pyqtgraph=True)
-        app.setStyleSheet(dark_stylesheet)
+        dark_stylesheet = get_dark_stylesheet()
+        if app.styleSheet() != dark_stylesheet:
+            app.setStyleSheet(dark_stylesheet)
     except ImportError:
         print("qdarkstyle not found. Using default Qt style.")
     except Exception as e:
@@ -8,6 +8,7 @@ import numpy as np
 from typing import List, Dict, Any
 from pyqtgraph.Qt import QtCore, QtWidgets
 import os
+import re
 
 from ..models.file_model import datReader
 from .app_controller import data_manager
@@ -15,6 +16,7 @@ from .app_controller import display_data
 from ..config.viewer_config import DEFAULT_AXIS_ORDERS
 
 from ..utils.config import load_config, ensure_example_config
+from ..utils.file_utils import walk_files
 
 
 class FileLoadingController(QtCore.QObject):
@@ -57,14 +59,10 @@ class FileLoadingController(QtCore.QObject):
             # Use datReader to load the file
             reader = datReader(path=file_path, python_dict=True, verbose=False)
             
-            # Get the images array
-            images_array = reader.getDatImagesArray()
-            
-            # Stack all images along the first axis (states axis)
-            if not images_array:
+            # Get all images stacked along the first axis (states axis)
+            raw_data_array = reader.getDatImagesStacked()
+            if raw_data_array.shape[0] == 0:
                 raise ValueError("Empty images array")
-            
-            raw_data_array = np.stack(images_array, axis=0)
             # Raw data is (states, spatial, spectral)
             
             # Extract state names via reader API (already excludes 'info')
@@ -99,7 +97,8 @@ class FileLoadingController(QtCore.QObject):
             processed_data = data_manager.rearranger.rearrange_data(
                 raw_data_array,
                 input_axes=input_axes,
-                target_axes=target_axes
+                target_axes=target_axes,
+                materialize=True
             )
             
             # Data successfully loaded and processed
@@ -622,16 +621,16 @@ class FileListingController(QtWidgets.QWidget):
         # First pass: collect all candidate files with their preference level
         candidates = []  # (root, file, is_preferred)
         
-        for root, dirs, files in os.walk(directories[0]):
-            dat_files_in_dir = [f for f in files if f.endswith('.dat')]
-            for file in dat_files_in_dir:
-                # Check exclusions first
-                excluded = any(exclude in file for exclude in excludes)
-                if excluded:
+        # One compiled alternation instead of a substring test per exclude term
+        exclude_pattern = re.compile('|'.join(map(re.escape, excludes))) if excludes else None
+        
+        for root, files in walk_files(directories[0], '.dat'):
+            # Determine if this is a preferred location (in_dir is in path)
+            is_preferred = in_dir in root if in_dir else True
+            for file in files:
+                # Check exclusions
+                if exclude_pattern is not None and exclude_pattern.search(file):
                     continue
-                
-                # Determine if this is a preferred location (in_dir is in path)
-                is_preferred = in_dir in root if in_dir else True
                 candidates.append((root, file, is_preferred))
         
         # If we have any preferred candidates, use only those
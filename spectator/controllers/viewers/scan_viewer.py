@@ -5,11 +5,11 @@
 import numpy as np
 import pyqtgraph as pg
 from pyqtgraph.Qt import QtWidgets
-import qdarkstyle
 from pyqtgraph.dockarea.Dock import Dock
 from pyqtgraph.dockarea.DockArea import DockArea
 from ...utils.constants import CONTROL_PANEL_SIZE, get_initial_window_size
 from ...utils.fixed_dock_label import FixedDockLabel
+from ...utils.colors import get_dark_stylesheet
 from typing import List, Dict, Any
 
 from ...views import PlotControlWidget
@@ -19,6 +19,7 @@ from ...views.windows import (
     StokesSpectrumYImageWindow
 )
 from ...models import AxisConfigs
+from ...utils.synchronization import flush_connections
 
 
 def scan_viewer(data: np.ndarray, title: str = 'scan viewer', state_names: List[str] = None, scale_info: Dict[str, Any] = None):
@@ -78,9 +79,10 @@ def scan_viewer(data: np.ndarray, title: str = 'scan viewer', state_names: List[
         # Shapes: spectral, spatial_y, spatial_x (after rearrangement)
         if state_data.ndim != 3:
             raise ValueError(f"scan_viewer expects per-state 3D data (spectral, y, x); got shape {state_data.shape}")
+        n_y, n_spectral, n_x = state_data.shape
 
         stokes_data_wl_x = state_data[0, :, :]  # (spectral, x) - slice at y=0
-        initial_spec_y = state_data[:, :, 0].T if state_data.shape[2] > 0 else np.zeros((stokes_data_wl_x.shape[0], state_data.shape[0]))
+        initial_spec_y = state_data[:, :, 0].T if n_x > 0 else np.zeros((n_spectral, n_y))
 
         # Windows - use swapped config so x is on x-axis, spectral on y-axis (matches scan window)
         win_image_spectrum_x = StokesSpectrumImageWindow(stokes_data_wl_x, stokes_index=i, name=base_name, scale_info=scale_info, config=AxisConfigs.spectrum_image_window_swapped())
@@ -102,7 +104,6 @@ def scan_viewer(data: np.ndarray, title: str = 'scan viewer', state_names: List[
         try:
             if hasattr(win_image_spectrum_x, 'hLine'):
                 x_pos = float(win_image_spectrum_x.hLine.value())
-                n_x = stokes_data_wl_x.shape[1]
                 x_idx = int(np.clip(np.round(x_pos), 0, n_x - 1))
                 win_spectrum.update_spectrum_data(x_idx)
         except Exception:
@@ -224,11 +225,13 @@ def scan_viewer(data: np.ndarray, title: str = 'scan viewer', state_names: List[
 
     def _apply_state_slice_from_scan_crosshair(xpos: float, ypos: float, stokes_index: int):
         """Apply per-state (spectral, x) views from scan image crosshair (x=spatial_x, y=spatial_y)."""
-        y_idx = int(np.clip(np.round(ypos), 0, data[stokes_index].shape[0] - 1))
-        x_idx = int(np.clip(np.round(xpos), 0, data[stokes_index].shape[2] - 1))
+        state_data = data[stokes_index]  # (y, spectral, x)
+        n_y, n_spectral, n_x = state_data.shape
+        y_idx = int(np.clip(np.round(ypos), 0, n_y - 1))
+        x_idx = int(np.clip(np.round(xpos), 0, n_x - 1))
 
-        slice_wl_x = data[stokes_index][y_idx, :, :]  # (spectral, x)
-        slice_wl_y = data[stokes_index][:, :, x_idx].T  # (spectral, y)
+        slice_wl_x = state_data[y_idx, :, :]  # (spectral, x)
+        slice_wl_y = state_data[:, :, x_idx].T  # (spectral, y)
 
         # Update dependent windows
         image_spectra_x[stokes_index].set_data(slice_wl_x)
@@ -237,10 +240,8 @@ def scan_viewer(data: np.ndarray, title: str = 'scan viewer', state_names: List[
         spatial_x[stokes_index].set_full_data(slice_wl_x)
 
         # Use current spectral index from avg spectrum if available, otherwise spectrum vLine
-        if avg_spectrum_widget is not None:
-            spectral_idx = int(np.clip(np.round(avg_spectrum_widget.vLine.value()), 0, slice_wl_x.shape[0] - 1))
-        else:
-            spectral_idx = int(np.clip(np.round(spectra[stokes_index].vLine.value()), 0, slice_wl_x.shape[0] - 1))
+        spectral_source = avg_spectrum_widget if avg_spectrum_widget is not None else spectra[stokes_index]
+        spectral_idx = int(np.clip(np.round(spectral_source.vLine.value()), 0, n_spectral - 1))
 
         # Align crosshairs / selectors
         spectra[stokes_index].update_spectral_line(float(spectral_idx))
@@ -440,40 +441,41 @@ def scan_viewer(data: np.ndarray, title: str = 'scan viewer', state_names: List[
                 lambda x_min, x_max, y_min, y_max, spectrum_win=spectra[i]: spectrum_win.set_spectral_limits(x_min, x_max)
             )
 
-    # Connect axis limit controls
-    for spectrum_widget in spectra:
-        control_widget.xlamRangeChanged.connect(spectrum_widget.update_spectral_range)
-        control_widget.resetXlamRangeRequested.connect(spectrum_widget.reset_spectral_range)
-    for image_spectrum_widget in image_spectra_x:
-        control_widget.xlamRangeChanged.connect(image_spectrum_widget.update_spectral_range)
-        control_widget.resetXlamRangeRequested.connect(image_spectrum_widget.reset_spectral_range)
-    for image_spectrum_widget in image_spectra_y:
-        control_widget.xlamRangeChanged.connect(image_spectrum_widget.update_spectral_range)
-        control_widget.resetXlamRangeRequested.connect(image_spectrum_widget.reset_spectral_range)
-    for spatial_widget in spatial_x:
-        control_widget.spatialRangeChanged.connect(spatial_widget.update_spatial_range)
-        control_widget.resetSpatialRangeRequested.connect(spatial_widget.reset_spatial_range)
-    for image_spectrum_widget in image_spectra_x:
-        control_widget.spatialRangeChanged.connect(image_spectrum_widget.update_spatial_range)
-        control_widget.resetSpatialRangeRequested.connect(image_spectrum_widget.reset_spatial_range)
-    for scan_image in scan_images:
-        control_widget.spatialRangeChanged.connect(scan_image.update_spatial_x_range)
-        control_widget.resetSpatialRangeRequested.connect(scan_image.reset_spatial_x_range)
+    # Connect axis limit controls (wavelength connections are flushed after the window is shown)
+    spectral_widgets = spectra + image_spectra_x + image_spectra_y
+    spectral_updates = [w.update_spectral_range for w in spectral_widgets]
+    spectral_resets = [w.reset_spectral_range for w in spectral_widgets]
+    xlam_changed = control_widget.xlamRangeChanged
+    xlam_reset = control_widget.resetXlamRangeRequested
+    xlam_connections = []
+    for update, reset in zip(spectral_updates, spectral_resets):
+        xlam_connections.append((xlam_changed, update))
+        xlam_connections.append((xlam_reset, reset))
+
+    # Spatial x axis limits
+    spatial_x_updates = ([w.update_spatial_range for w in spatial_x + image_spectra_x]
+                         + [w.update_spatial_x_range for w in scan_images])
+    spatial_x_resets = ([w.reset_spatial_range for w in spatial_x + image_spectra_x]
+                        + [w.reset_spatial_x_range for w in scan_images])
+    connect_spatial_changed = control_widget.spatialRangeChanged.connect
+    connect_spatial_reset = control_widget.resetSpatialRangeRequested.connect
+    for update, reset in zip(spatial_x_updates, spatial_x_resets):
+        connect_spatial_changed(update)
+        connect_spatial_reset(reset)
 
     # Spatial y axis limits (scan viewer only)
-    for scan_image in scan_images:
-        control_widget.spatialYRangeChanged.connect(scan_image.update_spatial_y_range)
-        control_widget.resetSpatialYRangeRequested.connect(scan_image.reset_spatial_y_range)
-    for image_spectrum_widget in image_spectra_y:
-        control_widget.spatialYRangeChanged.connect(image_spectrum_widget.update_spatial_y_range)
-        control_widget.resetSpatialYRangeRequested.connect(image_spectrum_widget.reset_spatial_y_range)
-    for spatial_widget in spatial_y:
-        control_widget.spatialYRangeChanged.connect(spatial_widget.update_spatial_y_range)
-        control_widget.resetSpatialYRangeRequested.connect(spatial_widget.reset_spatial_y_range)
+    spatial_y_widgets = scan_images + image_spectra_y + spatial_y
+    spatial_y_updates = [w.update_spatial_y_range for w in spatial_y_widgets]
+    spatial_y_resets = [w.reset_spatial_y_range for w in spatial_y_widgets]
+    connect_spatial_y_changed = control_widget.spatialYRangeChanged.connect
+    connect_spatial_y_reset = control_widget.resetSpatialYRangeRequested.connect
+    for update, reset in zip(spatial_y_updates, spatial_y_resets):
+        connect_spatial_y_changed(update)
+        connect_spatial_y_reset(reset)
 
     if avg_spectrum_widget is not None:
-        control_widget.xlamRangeChanged.connect(avg_spectrum_widget.update_spectral_range)
-        control_widget.resetXlamRangeRequested.connect(avg_spectrum_widget.reset_spectral_range)
+        xlam_connections.append((xlam_changed, avg_spectrum_widget.update_spectral_range))
+        xlam_connections.append((xlam_reset, avg_spectrum_widget.reset_spectral_range))
         # Avg spectrum drives scan image wavelength index + spectral selectors
         for i in range(len(scan_images)):
             avg_spectrum_widget.spectralIndexChanged.connect(scan_images[i].update_wavelength_index)
@@ -496,11 +498,15 @@ def scan_viewer(data: np.ndarray, title: str = 'scan viewer', state_names: List[
         pass
     win.show()
     try:
-        dark_stylesheet = qdarkstyle.load_stylesheet_from_environment(is_pyqtgraph=True)
-        app.setStyleSheet(dark_stylesheet)
+        dark_stylesheet = get_dark_stylesheet()
+        if app.styleSheet() != dark_stylesheet:
+            app.setStyleSheet(dark_stylesheet)
     except Exception:
         pass
 
+    # Connect the queued wavelength range signals now that the window is up
+    flush_connections(xlam_connections)
+
     if created_app:
         app.exec_()
         return None
@@ -5,11 +5,11 @@
 import numpy as np
 import pyqtgraph as pg
 from pyqtgraph.Qt import QtWidgets
-import qdarkstyle
 from pyqtgraph.dockarea.Dock import Dock
 from pyqtgraph.dockarea.DockArea import DockArea
 from ...utils.constants import CONTROL_PANEL_SIZE, get_initial_window_size
 from ...utils.fixed_dock_label import FixedDockLabel
+from ...utils.colors import get_dark_stylesheet
 from typing import List, Dict, Any
 
 from ...views import PlotControlWidget
@@ -17,6 +17,7 @@ from ...views.windows import (
     StokesSpectrumWindow, StokesSpectrumImageWindow, StokesSpatialWindow
 )
 from ...models import AxisConfigs
+from ...utils.synchronization import flush_connections
 
 
 def spectator(data: np.ndarray, title: str = 'spectator', state_names: List[str] = None, scale_info: Dict[str, Any] = None, spatial_label: str = "x"):
@@ -221,24 +222,26 @@ def spectator(data: np.ndarray, title: str = 'spectator', state_names: List[str]
                 lambda x_min, x_max, y_min, y_max, spectrum_win=spectra[i]: spectrum_win.set_spectral_limits(x_min, x_max)
             )
     
-    # Connect the xlamRangeChanged signal 
-
-    for spectrum_widget in spectra:
-        control_widget.xlamRangeChanged.connect(spectrum_widget.update_spectral_range)
-        control_widget.resetXlamRangeRequested.connect(spectrum_widget.reset_spectral_range)
-        
-    for image_spectrum_widget in image_spectra:
-        control_widget.xlamRangeChanged.connect(image_spectrum_widget.update_spectral_range)
-        control_widget.resetXlamRangeRequested.connect(image_spectrum_widget.reset_spectral_range)
+    # Queue the xlamRangeChanged connections; they are flushed once the window is shown
+    spectral_widgets = spectra + image_spectra
+    spectral_updates = [w.update_spectral_range for w in spectral_widgets]
+    spectral_resets = [w.reset_spectral_range for w in spectral_widgets]
+    xlam_changed = control_widget.xlamRangeChanged
+    xlam_reset = control_widget.resetXlamRangeRequested
+    xlam_connections = []
+    for update, reset in zip(spectral_updates, spectral_resets):
+        xlam_connections.append((xlam_changed, update))
+        xlam_connections.append((xlam_reset, reset))
 
     # Connect the spatialRangeChanged signal for x-axis (spatial pixel) limits
-    for image_spectrum_widget in image_spectra:
-        control_widget.spatialRangeChanged.connect(image_spectrum_widget.update_spatial_range)
-        control_widget.resetSpatialRangeRequested.connect(image_spectrum_widget.reset_spatial_range)
-
-    for spatial_widget in spatial:
-        control_widget.spatialRangeChanged.connect(spatial_widget.update_spatial_range)
-        control_widget.resetSpatialRangeRequested.connect(spatial_widget.reset_spatial_range)
+    spatial_widgets = image_spectra + spatial
+    spatial_updates = [w.update_spatial_range for w in spatial_widgets]
+    spatial_resets = [w.reset_spatial_range for w in spatial_widgets]
+    connect_spatial_changed = control_widget.spatialRangeChanged.connect
+    connect_spatial_reset = control_widget.resetSpatialRangeRequested.connect
+    for update, reset in zip(spatial_updates, spatial_resets):
+        connect_spatial_changed(update)
+        connect_spatial_reset(reset)
 
     # Set widget collections for synchronization
     control_widget.set_widget_collections(image_spectra, spectra, spatial)
@@ -252,13 +255,17 @@ def spectator(data: np.ndarray, title: str = 'spectator', state_names: List[str]
     win.show()
     try:
         # Use environment variable or default to dark style
-        dark_stylesheet = qdarkstyle.load_stylesheet_from_environment(is_pyqtgraph=True)
-        app.setStyleSheet(dark_stylesheet)
+        dark_stylesheet = get_dark_stylesheet()
+        if app.styleSheet() != dark_stylesheet:
+            app.setStyleSheet(dark_stylesheet)
     except ImportError:
         print("qdarkstyle not found. Using default Qt style.")
     except Exception as e:
         print(f"Could not apply qdarkstyle: {e}")
 
+    # Connect the queued wavelength range signals now that the window is up
+    flush_connections(xlam_connections)
+
     # If we created the QApplication here, start the event loop; otherwise, return window for embedding
     if created_app:
         app.exec()
@@ -3,16 +3,18 @@ Models package for the spectral data viewer.
 """
 
 from .axis_types import AxisType
+# Kept for backwards compatibility; new code should import it from utils.constants
 from ..utils.constants import (
     get_default_min_line_distance
 )
 from .axis_config import AxisConfig, AxisConfigs
-from .plot_data_model import PlotDataModel
+from .plot_data_model import PlotDataModel, mean_along_axis
 
 __all__ = [
     'AxisType',
     'get_default_min_line_distance',
     'AxisConfig',
     'AxisConfigs',
-    'PlotDataModel'
+    'PlotDataModel',
+    'mean_along_axis'
 ]
@@ -10,7 +10,7 @@ from typing import Tuple
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class AxisConfig:
     """Configuration for how data dimensions map to plot axes.
     
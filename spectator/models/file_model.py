@@ -1,6 +1,53 @@
-from scipy.io import readsav
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+from .plot_data_model import mean_along_axis
+
+# Upper bound on threads used to reduce state arrays in parallel
+MAX_REDUCE_WORKERS = 8
+
+# Floating point images are stored at this precision; wider floats are narrowed
+# so the averaging done while browsing moves half the memory
+IMAGE_FLOAT_DTYPE = np.float32
+
+
+def _reduce_to_2d(arr: np.ndarray):
+    """
+    Reduce a state array to 2D by averaging over its smallest axes.
+
+    Returns None for arrays that cannot be turned into an image (1D, or
+    anything that fails to reduce).
+    """
+    try:
+        if arr.ndim == 2:
+            return np.asarray(arr)
+        if arr.ndim < 3:
+            # 1D or others are not usable for images
+            return None
+
+        # Choose axis with smallest size to average over
+        axis = min(range(arr.ndim), key=arr.shape.__getitem__)
+        reduced_arr = mean_along_axis(arr, axis)
+        # If still >2D (e.g., averaged axis in middle), keep averaging singleton axes if any
+        while reduced_arr.ndim > 2:
+            # Prefer averaging over any axis with size 1 first, otherwise the smallest
+            sizes = reduced_arr.shape
+            if 1 in sizes:
+                axis2 = sizes.index(1)
+            else:
+                axis2 = min(range(len(sizes)), key=sizes.__getitem__)
+            reduced_arr = mean_along_axis(reduced_arr, axis2)
+
+        # Ensure 2D
+        if reduced_arr.ndim != 2:
+            return None
+        return np.asarray(reduced_arr)
+    except Exception:
+        return None
+
 
 class datReader:
     """
@@ -12,22 +59,37 @@ class datReader:
       Example: (2, 560, 1260) -> average over axis 0 -> (560, 1260).
     - After reducing to 2D candidates, selects the majority common shape and drops
       states that do not match that shape (e.g., tiny 2x2 placeholders).
-    - Exposes processed images and state names consistently.
+    - Exposes processed images and state names consistently. The selected images
+      are stored as one contiguous (n_states, H, W) array; per-state images are
+      views into it. Floating point images wider than IMAGE_FLOAT_DTYPE are
+      stored as IMAGE_FLOAT_DTYPE.
+    - The file is only read on first access, and the raw dict is released once
+      the states are processed so non-image variables do not stay in memory.
     """
 
     def __init__(self, path: str = "", python_dict: bool = True, verbose: bool = False):
         self.path = path
         self.verbose = verbose
         self.python_dict = python_dict
-        # Raw dict as read from file (may contain extra fields like 'info')
-        self.dat = readsav(self.path, None, self.python_dict, None, self.verbose)
+        # Raw dict as read from file (may contain extra fields like 'info'), read on demand
+        self._dat = None
 
         # Processed outputs (computed lazily)
         self._processed = False
+        self._images_3d: np.ndarray = np.empty((0, 0, 0))
         self._images_2d: list[np.ndarray] = []
         self._state_names: list[str] = []
         self._info = None
 
+    @property
+    def dat(self):
+        """Raw dict as read from file; the file is read on first access."""
+        if self._dat is None:
+            # scipy.io is slow to import; only load it once a file is actually read
+            from scipy.io import readsav
+            self._dat = readsav(self.path, None, self.python_dict, None, self.verbose)
+        return self._dat
+
     def _ensure_processed(self):
         if self._processed:
             return
@@ -41,75 +103,54 @@ class datReader:
                     return str(x)
             return str(x)
 
+        # Single pass over the raw dict: pick up 'info' (case/bytes-insensitive, first
+        # match wins) and collect candidate arrays per state key
         self._info = None
-        try:
-            for key in self.dat:
-                key_s = _to_str(key).strip()
-                if key_s.lower() == 'info':
-                    try:
-                        self._info = self.dat[key]
-                        break
-                    except Exception:
-                        pass
-        except Exception:
-            self._info = None
-
-        # Collect candidate arrays per state key (exclude 'info')
         candidates: list[tuple[str, np.ndarray]] = []
+        # Read errors (missing or corrupt file) propagate to the caller and
+        # leave the reader unprocessed; only iteration of the result is guarded
+        raw = self.dat
         try:
-            # readsav result behaves like dict; iterate keys
-            for key in self.dat:
+            # readsav result behaves like dict
+            for key, arr in raw.items():
                 key_s = _to_str(key).strip()
-                # Exclude info-key regardless of case/coding
                 if key_s.lower() == 'info':
+                    if self._info is None:
+                        self._info = arr
                     continue
-                arr = self.dat[key]
                 if isinstance(arr, np.ndarray):
                     candidates.append((key_s, arr))
         except Exception:
-            # If iteration fails, fall back to attributes access is not supported; leave empty
+            # If iteration fails, leave candidates empty
             candidates = []
 
         # Reduce each candidate to a 2D array, choosing the axis with the smallest size when reduction is needed
         reduced: list[tuple[str, np.ndarray]] = []
-        shape_votes: dict[tuple[int, int], int] = {}
-
-        for name, arr in candidates:
-            try:
-                if arr.ndim == 2:
-                    reduced_arr = arr
-                elif arr.ndim >= 3:
-                    # Choose axis with smallest size to average over
-                    axis = int(np.argmin(arr.shape))
-                    reduced_arr = arr.mean(axis=axis)
-                    # If still >2D (e.g., averaged axis in middle), keep averaging singleton axes if any
-                    while reduced_arr.ndim > 2:
-                        # Prefer averaging over any axis with size 1 first, otherwise the smallest
-                        sizes = reduced_arr.shape
-                        if 1 in sizes:
-                            axis2 = int(list(sizes).index(1))
-                        else:
-                            axis2 = int(np.argmin(sizes))
-                        reduced_arr = reduced_arr.mean(axis=axis2)
-                else:
-                    # 1D or others are not usable for images
-                    continue
-
-                # Ensure 2D
-                if reduced_arr.ndim != 2:
-                    continue
-
-                shape = (int(reduced_arr.shape[0]), int(reduced_arr.shape[1]))
-                shape_votes[shape] = shape_votes.get(shape, 0) + 1
-                reduced.append((name, np.asarray(reduced_arr)))
-            except Exception:
+        shape_votes: Counter[tuple[int, int]] = Counter()
+
+        # NumPy releases the GIL in the reductions, so several 3D states can be
+        # averaged at once; map() keeps the results in candidate order
+        arrays = [arr for _, arr in candidates]
+        n_workers = min(MAX_REDUCE_WORKERS, os.cpu_count() or 1,
+                        sum(arr.ndim >= 3 for arr in arrays))
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                reduced_arrays = list(executor.map(_reduce_to_2d, arrays))
+        else:
+            reduced_arrays = [_reduce_to_2d(arr) for arr in arrays]
+
+        for (name, _), reduced_arr in zip(candidates, reduced_arrays):
+            if reduced_arr is None:
                 continue
+            shape = (int(reduced_arr.shape[0]), int(reduced_arr.shape[1]))
+            shape_votes[shape] += 1
+            reduced.append((name, reduced_arr))
 
         # Choose majority shape (highest vote). If tie, choose the one with largest area.
         target_shape: tuple[int, int] | None = None
         if shape_votes:
-            # Sort by (count desc, area desc)
-            target_shape = sorted(shape_votes.items(), key=lambda kv: (kv[1], kv[0][0] * kv[0][1]), reverse=True)[0][0]
+            # Single pass for the max of (count, area); the first shape seen wins full ties
+            target_shape = max(shape_votes.items(), key=lambda kv: (kv[1], kv[0][0] * kv[0][1]))[0]
 
         images_2d: list[np.ndarray] = []
         state_names: list[str] = []
@@ -119,10 +160,24 @@ class datReader:
                     state_names.append(name)
                     images_2d.append(arr2d)
 
+        # Copy the selected states into one contiguous (n_states, H, W) block
+        if images_2d:
+            dtype = np.result_type(*images_2d)
+            if dtype.kind == 'f' and dtype.itemsize > np.dtype(IMAGE_FLOAT_DTYPE).itemsize:
+                dtype = np.dtype(IMAGE_FLOAT_DTYPE)
+            images_3d = np.empty((len(images_2d), *target_shape), dtype=dtype)
+            for k, img in enumerate(images_2d):
+                images_3d[k] = img
+        else:
+            images_3d = np.empty((0, 0, 0))
+
         # Persist results
-        self._images_2d = images_2d
+        self._images_3d = images_3d
+        self._images_2d = list(images_3d)
         self._state_names = state_names
         self._processed = True
+        # Drop the raw dict; only the selected images and info are kept alive
+        self._dat = None
 
     def getDat(self):
         """Return a processed dict with harmonized states and preserved 'info'."""
@@ -143,6 +198,11 @@ class datReader:
         self._ensure_processed()
         return list(self._images_2d)
 
+    def getDatImagesStacked(self):
+        """Return the selected states as one contiguous (n_states, H, W) array."""
+        self._ensure_processed()
+        return self._images_3d
+
     def getStateNames(self):
         """Return the processed state names aligned with images (excludes 'info')."""
         self._ensure_processed()
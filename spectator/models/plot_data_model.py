@@ -6,10 +6,67 @@ slicing operations, and coordinate transformations across different window types
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, Optional
 from .axis_config import AxisConfig
 
 
+@lru_cache(maxsize=64)
+def index_array(size: int) -> np.ndarray:
+    """Return the shared index array [0, 1, ..., size-1].
+    
+    Every window over the same data has the same axis lengths, so one
+    read-only array per size is shared instead of allocating per model
+    and per data update.
+    
+    Args:
+        size: Length of the dimension
+        
+    Returns:
+        Read-only integer array of indices
+    """
+    indices = np.arange(size)
+    indices.setflags(write=False)
+    return indices
+
+
+def mean_along_axis(data: np.ndarray, axis: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Average data along one axis.
+    
+    Floating point data is contracted against uniform weights: BLAS fuses the
+    strided walk and the reduction into one pass, which is several times
+    faster than mean(). Other dtypes fall back to mean().
+    
+    Args:
+        data: Array to reduce (usually a contiguous index range of a larger array)
+        axis: Axis to average over
+        out: Optional preallocated array to write the result into; 2D floating
+            point data is then reduced directly into it without a temporary
+        
+    Returns:
+        Averaged data array (reduced by one dimension), or out if given
+    """
+    is_float = np.issubdtype(data.dtype, np.floating)
+    if out is not None:
+        # np.dot only writes into a native byte order out of the data's precision
+        # (raw readsav data may be big-endian, e.g. '>f4')
+        native = data.dtype.newbyteorder('=')
+        if is_float and data.ndim == 2 and data.shape[axis] > 0 and out.dtype == native:
+            weights = np.full(data.shape[axis], 1.0 / data.shape[axis], dtype=native)
+            if axis == 0:
+                return np.dot(weights, data, out=out)
+            return np.dot(data, weights, out=out)
+        np.copyto(out, mean_along_axis(data, axis))
+        return out
+    
+    if not is_float or data.shape[axis] == 0:
+        return data.mean(axis=axis)
+    
+    n_samples = data.shape[axis]
+    weights = np.full(n_samples, 1.0 / n_samples, dtype=data.dtype)
+    return np.tensordot(weights, data, axes=([0], [axis]))
+
+
 class PlotDataModel:
     """Encapsulates data and axis configuration for plot windows.
     
@@ -25,22 +82,47 @@ class PlotDataModel:
         config: AxisConfig defining how to plot the data
         shape: Shape of the data array
         ndim: Number of dimensions in the data
+        column_mirror: Keep a Fortran-ordered copy of 2D data so that
+            column slices (dim 1) are contiguous reads
     """
     
-    def __init__(self, data: np.ndarray, config: AxisConfig):
+    def __init__(self, data: np.ndarray, config: AxisConfig, column_mirror: bool = False,
+                 force_contiguous: bool = False):
         """Initialize the data model.
         
         Args:
             data: Numpy array of any dimensionality
             config: AxisConfig specifying how to plot this data
+            column_mirror: If True, mirror 2D data in Fortran order for fast
+                column access. Costs one extra copy of the data, rebuilt on
+                every update_data(), so only use it for data that rarely changes.
+            force_contiguous: If True, copy non C-contiguous input (e.g. a
+                transposed view) once here so later row slices are contiguous.
+                Data passed to update_data() is kept as given.
         """
+        if force_contiguous:
+            data = np.ascontiguousarray(data)
         self.data = data
         self.config = config
         self.shape = data.shape
         self.ndim = data.ndim
+        self.column_mirror = column_mirror
         
         # Create index arrays for each dimension
-        self._index_arrays = tuple(np.arange(s) for s in self.shape)
+        self._index_arrays = tuple(index_array(s) for s in self.shape)
+        self._refresh_column_mirror()
+        
+        # Averages over a full dimension, keyed by dim; cleared in update_data()
+        self._full_means = {}
+        # Reusable output arrays for region averages, keyed by dim
+        self._avg_buffers = {}
+    
+    def _refresh_column_mirror(self):
+        """(Re)build the Fortran-ordered mirror used for column slices."""
+        if self.column_mirror and self.ndim == 2 and not self.data.flags.f_contiguous:
+            self._data_f = np.asfortranarray(self.data)
+        else:
+            self._data_f = None
     
     def get_slice_at_index(self, dim: int, index: int) -> np.ndarray:
         """Get a slice along specified dimension at given index.
@@ -61,18 +143,42 @@ class PlotDataModel:
         
         index = self.validate_index(dim, index)
         
+        # Column of 2D data: read it contiguously from the mirror if there is one
+        if dim == 1 and self._data_f is not None:
+            return self._data_f[:, index]
+        
         # Build slice tuple
         slices = [slice(None)] * self.ndim
         slices[dim] = index
         return self.data[tuple(slices)]
     
-    def get_averaged_slice(self, dim: int, start: int, end: int) -> np.ndarray:
+    def _averaging_buffer(self, dim: int) -> np.ndarray:
+        """Return the reusable output array for averages along dim.
+        
+        The array is reallocated only when the data shape or dtype changes. It
+        always uses native byte order, also for non-native (e.g. '>f4') data.
+        """
+        shape = self.shape[:dim] + self.shape[dim + 1:]
+        if np.issubdtype(self.data.dtype, np.floating):
+            dtype = self.data.dtype.newbyteorder('=')
+        else:
+            dtype = np.dtype(np.float64)
+        buffer = self._avg_buffers.get(dim)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._avg_buffers[dim] = buffer
+        return buffer
+    
+    def get_averaged_slice(self, dim: int, start: int, end: int, reuse_buffer: bool = False) -> np.ndarray:
         """Get averaged slice along dimension between start and end indices.
         
         Args:
             dim: Dimension to slice and average along
             start: Starting index (inclusive)
             end: Ending index (inclusive)
+            reuse_buffer: Write the average into an array owned by the model
+                instead of allocating a new one. The result is overwritten by
+                the next call with reuse_buffer for the same dim.
             
         Returns:
             Averaged data array (reduced by one dimension)
@@ -91,13 +197,25 @@ class PlotDataModel:
         if start > end:
             start, end = end, start
         
+        # The full range does not depend on the region, so compute it once
+        full_range = start == 0 and end == self.shape[dim] - 1
+        if full_range and dim in self._full_means:
+            return self._full_means[dim]
+        
         # Build slice tuple
         slices = [slice(None)] * self.ndim
         slices[dim] = slice(start, end + 1)
         
         # Get slice and average along the specified dimension
         data_slice = self.data[tuple(slices)]
-        return data_slice.mean(axis=dim)
+        if reuse_buffer and not full_range:
+            return mean_along_axis(data_slice, dim, out=self._averaging_buffer(dim))
+        averaged = mean_along_axis(data_slice, dim)
+        if full_range:
+            # Shared between callers, so guard it against in-place edits
+            averaged.setflags(write=False)
+            self._full_means[dim] = averaged
+        return averaged
     
     def get_plot_data(self, data_slice: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Convert data slice to (x, y) coordinates for setData().
@@ -123,7 +241,35 @@ class PlotDataModel:
         if dim < 0 or dim >= self.ndim:
             raise ValueError(f"Dimension {dim} out of range for {self.ndim}D data")
         
-        return int(np.clip(index, 0, self.shape[dim] - 1))
+        # Plain min/max: np.clip on a scalar goes through ufunc dispatch and is
+        # an order of magnitude slower on this per-crosshair path
+        return int(min(max(index, 0), self.shape[dim] - 1))
+    
+    def nearest_index(self, dim: int, value: float) -> int:
+        """Find the index whose coordinate is closest to value.
+        
+        The index arrays are monotonic, so a bisection plus one neighbour
+        comparison replaces a full argmin over the axis. Ties resolve to the
+        lower index, as argmin does.
+        
+        Args:
+            dim: Dimension to search
+            value: Coordinate to look up
+            
+        Returns:
+            Nearest index along dim, or -1 if the dimension is empty
+        """
+        indices = self.get_index_array(dim)
+        n = indices.size
+        if n == 0:
+            return -1
+        
+        i = int(np.searchsorted(indices, value))
+        if i == 0:
+            return 0
+        if i == n:
+            return n - 1
+        return i if abs(indices[i] - value) < abs(indices[i - 1] - value) else i - 1
     
     def update_data(self, new_data: np.ndarray):
         """Update the underlying data array.
@@ -142,7 +288,9 @@ class PlotDataModel:
         
         self.data = new_data
         self.shape = new_data.shape
-        self._index_arrays = tuple(np.arange(s) for s in self.shape)
+        self._index_arrays = tuple(index_array(s) for s in self.shape)
+        self._refresh_column_mirror()
+        self._full_means = {}
     
     def get_dimension_size(self, dim: int) -> int:
         """Get the size of a specific dimension.
@@ -3,51 +3,54 @@ Utilities package for the spectral data viewer.
 
 This package contains utility functions, constants, and helper classes
 organized by functionality.
+
+The re-exports below are resolved lazily (PEP 562): a submodule is only
+imported when one of its names is first accessed, so e.g. reading a
+constant does not pull in the pyqtgraph-based plotting helpers.
 """
 
-# Constants and configuration
-from .constants import (
-    MIN_LINE_DISTANCE,
-    DEFAULT_N_STOKES, DEFAULT_N_WL, DEFAULT_N_X, 
-    DEFAULT_LINE_WIDTH, ColorSchemes, GrayPalette, BluePalette,
-    MAX_STATES, MAX_SPATIAL_AXES
-)
-
-# Plotting utilities
-from .plotting import (
-    add_line, add_crosshair, create_histogram,
-    initialize_image_plot_item, initialize_spectrum_plot_item,
-    set_plot_wavelength_range, reset_plot_wavelength_range,
-    update_crosshair_from_mouse, create_wavelength_limit_controls,
-    create_y_limit_controls, apply_dark_theme, apply_light_theme
-)
-
-# Data utilities
-from .data_utils import (
-    generate_example_data_3d, generate_example_data_4d
-)
-
-# Color utilities
-from .colors import getWidgetColors
-
-__all__ = [
-    # Constants
-    'MIN_LINE_DISTANCE',
-    'DEFAULT_N_STOKES', 'DEFAULT_N_WL', 'DEFAULT_N_X',
-    'DEFAULT_LINE_WIDTH', 'ColorSchemes', 'GrayPalette', 'BluePalette',
-    'MAX_STATES', 'MAX_SPATIAL_AXES',
-    
+import importlib
+
+# Re-exported name -> submodule that defines it
+_LAZY = {
+    # Constants and configuration
+    'MIN_LINE_DISTANCE': 'constants',
+    'DEFAULT_N_STOKES': 'constants', 'DEFAULT_N_WL': 'constants', 'DEFAULT_N_X': 'constants',
+    'DEFAULT_LINE_WIDTH': 'constants', 'ColorSchemes': 'constants',
+    'GrayPalette': 'constants', 'BluePalette': 'constants',
+    'MAX_STATES': 'constants', 'MAX_SPATIAL_AXES': 'constants',
+
     # Plotting utilities
-    'add_line', 'add_crosshair', 'create_histogram',
-    'initialize_image_plot_item', 'initialize_spectrum_plot_item',
-    'set_plot_wavelength_range', 'reset_plot_wavelength_range',
-    'update_crosshair_from_mouse', 'create_wavelength_limit_controls',
-    'create_y_limit_controls', 'apply_dark_theme', 'apply_light_theme',
-    
+    'add_line': 'plotting', 'add_crosshair': 'plotting', 'create_histogram': 'plotting',
+    'initialize_image_plot_item': 'plotting', 'initialize_spectrum_plot_item': 'plotting',
+    'set_plot_wavelength_range': 'plotting', 'reset_plot_wavelength_range': 'plotting',
+    'wavelength_extent': 'plotting',
+    'update_crosshair_from_mouse': 'plotting', 'map_scene_to_view': 'plotting',
+    'set_label_text': 'plotting',
+    'create_wavelength_limit_controls': 'plotting',
+    'create_y_limit_controls': 'plotting', 'apply_dark_theme': 'plotting',
+    'apply_light_theme': 'plotting',
+
     # Data utilities
-    'generate_example_data_3d', 'generate_example_data_4d',
-    
+    'generate_example_data_3d': 'data_utils', 'generate_example_data_4d': 'data_utils',
+
     # Color utilities
-    'getWidgetColors',
-    
-]
+    'getWidgetColors': 'colors',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
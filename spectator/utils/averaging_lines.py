@@ -5,15 +5,16 @@ This module provides a unified approach to handling both spectral (vertical) and
 averaging lines, eliminating code duplication and providing a consistent interface.
 """
 
-import numpy as np
 import pyqtgraph as pg
 from typing import Optional, Tuple, Callable
 from .colors import getWidgetColors
 from .constants import DEFAULT_LABEL_SIZE
 from pyqtgraph.Qt import QtCore
-from .plotting import add_line, SOLID_LINE, DOT_LINE, DASH_LINE
+from .plotting import add_line, set_label_text, SOLID_LINE, DOT_LINE, DASH_LINE
 
 MIN_LINE_DISTANCE = 3
+# Minimum interval between regionChanged emissions while a line is dragged (~30 Hz)
+REGION_EMIT_INTERVAL_MS = 33
 
 
 class AveragingLineManager(QtCore.QObject):
@@ -45,9 +46,13 @@ class AveragingLineManager(QtCore.QObject):
         self.plot_item = plot_item
         self.orientation = orientation
         self.data_range = data_range
+        # Highest valid line position, cached for the clamping helpers
+        self._hi = float(data_range - 1)
         self.stokes_index = stokes_index
         self.color_key = color_key
         self.label_widget = label_widget
+        # Line color, resolved once for the lines and drag previews
+        self.color = getWidgetColors().get(color_key, 'yellow')
         
         # Line references
         self.line1: Optional[pg.InfiniteLine] = None
@@ -63,12 +68,27 @@ class AveragingLineManager(QtCore.QObject):
         # These can be set by the window to handle UI activation/notifications
         self.on_region_created: Optional[Callable[[], None]] = None
         self.on_region_removed: Optional[Callable[[], None]] = None
+        # Called whenever default lines are created (activates the window's button)
+        self._button_activation_callback: Optional[Callable[[], None]] = None
+
+        # Set while the manager moves its own lines, so the position-changed
+        # slots ignore the resulting re-entrant signals
+        self._updating = False
+        # Last (pos1, center, pos2) sent with regionChanged, to drop repeats
+        self._last_emitted: Optional[Tuple[float, float, float]] = None
 
         # Preview drag state
         self._drag_start_pos: Optional[float] = None
         self._temp_line_press: Optional[pg.InfiniteLine] = None
         self._temp_line_drag: Optional[pg.InfiniteLine] = None
         
+        # Drag updates are coalesced: the lines follow the mouse immediately, but
+        # regionChanged (which re-averages and redraws other windows) is emitted
+        # at most once per interval, with the positions current at that time
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self._emit_region)
+        
     def set_data_range(self, new_range: int) -> None:
         """Update the valid data range and clamp any existing line positions.
 
@@ -77,6 +97,7 @@ class AveragingLineManager(QtCore.QObject):
         """
         # Ensure a valid positive range
         self.data_range = max(1, int(new_range))
+        self._hi = float(self.data_range - 1)
 
         # If lines exist, re-apply their positions to clamp within the new range
         positions = self.get_positions()
@@ -105,17 +126,15 @@ class AveragingLineManager(QtCore.QObject):
         self.remove_lines()
         
         # Create new lines
-        colors = getWidgetColors()
-        color = colors.get(self.color_key, 'yellow')
+        color = self.color
         
         self.line1 = add_line(self.plot_item, color, self.angle, pos=pos1, moveable=True, style=SOLID_LINE, is_averaging_line=True)
         self.line2 = add_line(self.plot_item, color, self.angle, pos=pos2, moveable=True, style=SOLID_LINE, is_averaging_line=True)
         self.center_line = add_line(self.plot_item, color, self.angle, pos=center_pos, moveable=True, style=DOT_LINE, is_averaging_line=True)
         
         # Connect signals
-        self.line1.sigPositionChanged.connect(lambda line: self._update_lines_and_emit(source_line=line))
-        self.line2.sigPositionChanged.connect(lambda line: self._update_lines_and_emit(source_line=line))
-        self.center_line.sigPositionChanged.connect(lambda line: self._update_lines_and_emit(source_line=line))
+        for line in (self.line1, self.line2, self.center_line):
+            line.sigPositionChanged.connect(self._on_line_moved)
         
         # Initial update
         self._update_lines_and_emit(source_line=self.line1)
@@ -128,7 +147,7 @@ class AveragingLineManager(QtCore.QObject):
                 pass
                 
         # Also fire callback for button activation (even if lines existed before)
-        if self.has_lines() and hasattr(self, '_button_activation_callback') and self._button_activation_callback:
+        if self._button_activation_callback and self.has_lines():
             try:
                 self._button_activation_callback()
             except Exception:
@@ -137,8 +156,16 @@ class AveragingLineManager(QtCore.QObject):
     def remove_lines(self) -> None:
         """Remove all averaging lines from the plot."""
         had_lines_before = self.has_lines()
+        # Drop any drag update still waiting to be emitted
+        self._emit_timer.stop()
+        self._last_emitted = None
         for line in [self.line1, self.line2, self.center_line]:
             if line is not None:
+                # Disconnect first so no queued move reaches the manager during teardown
+                try:
+                    line.sigPositionChanged.disconnect(self._on_line_moved)
+                except (TypeError, RuntimeError):
+                    pass
                 self.plot_item.removeItem(line)
         
         self.line1 = None
@@ -158,7 +185,7 @@ class AveragingLineManager(QtCore.QObject):
     
     def has_lines(self) -> bool:
         """Check if averaging lines exist."""
-        return all(line is not None for line in [self.line1, self.line2, self.center_line])
+        return self.line1 is not None and self.line2 is not None and self.center_line is not None
     
     def get_positions(self) -> Optional[Tuple[float, float, float]]:
         """Get current line positions as (pos1, center, pos2)."""
@@ -174,55 +201,64 @@ class AveragingLineManager(QtCore.QObject):
             pos1: Position of first line
             center: Position of center line
             pos2: Position of second line
-            block_signals: Whether to block signals during update
+            block_signals: Whether to suppress the manager's own line-moved handling during update
         """
-        if not self.has_lines():
+        line1, line2, center_line = self.line1, self.line2, self.center_line
+        if line1 is None or line2 is None or center_line is None:
             return
             
         if block_signals:
-            self.line1.blockSignals(True)
-            self.line2.blockSignals(True)
-            self.center_line.blockSignals(True)
+            self._updating = True
+        # The lines move without an emission, so the next one must not be dropped
+        self._last_emitted = None
 
         try:
-            # Normalize ordering and width, then apply unified constraints
+            # Normalize ordering, then apply unified constraints (_constrain_region
+            # enforces the minimum width). Plain comparisons beat min/max calls
+            # here: in CPython the cost is the call, not branch prediction.
             if pos1 > pos2:
                 pos1, pos2 = pos2, pos1
-            requested_width = max(MIN_LINE_DISTANCE, float(pos2 - pos1))
+            requested_width = float(pos2 - pos1)
             requested_center = (pos1 + pos2) / 2.0 if center is None else float(center)
 
             new_pos1, new_center, new_pos2 = self._constrain_region(requested_center, requested_width)
 
             # Update line positions
-            self.line1.setValue(new_pos1)
-            self.line2.setValue(new_pos2)
-            self.center_line.setValue(new_center)
+            line1.setValue(new_pos1)
+            line2.setValue(new_pos2)
+            center_line.setValue(new_center)
 
             # Update label
             self._update_label(new_pos1, new_center, new_pos2)
 
         finally:
             if block_signals:
-                self.line1.blockSignals(False)
-                self.line2.blockSignals(False)
-                self.center_line.blockSignals(False)
+                self._updating = False
     
+    # The helpers below run on every line drag event; they clamp with plain
+    # comparisons against the cached upper bound (same semantics as np.clip)
+    # to avoid ufunc dispatch and builtin calls on scalars.
     def _clamp_position(self, pos: float) -> float:
         """Clamp position to valid data range."""
-        return np.clip(pos, 0, self.data_range - 1)
+        hi = self._hi
+        return 0.0 if pos < 0.0 else (hi if pos > hi else pos)
     
     def _bounded_width(self, width: float) -> float:
         """Ensure requested width fits within data bounds and respects minimum distance."""
-        max_width = max(1.0, (self.data_range - 1))
-        return float(np.clip(width, MIN_LINE_DISTANCE, max_width))
+        hi = self._hi
+        max_width = hi if hi > 1.0 else 1.0
+        if width < MIN_LINE_DISTANCE:
+            width = MIN_LINE_DISTANCE
+        return float(max_width if width > max_width else width)
 
     def _constrain_region(self, center: float, width: float) -> Tuple[float, float, float]:
         """Given a desired center and width, return (pos1, center, pos2) constrained to data bounds."""
         w = self._bounded_width(width)
         spacing = w / 2.0
         min_center = spacing
-        max_center = (self.data_range - 1) - spacing
-        c = float(np.clip(center, min_center, max_center))
+        max_center = self._hi - spacing
+        c = min_center if center < min_center else center
+        c = float(max_center if c > max_center else c)
         p1 = c - spacing
         p2 = c + spacing
         return p1, c, p2
@@ -233,7 +269,9 @@ class AveragingLineManager(QtCore.QObject):
             return
         t1, t2, t3 = self.label_terms
         try:
-            self.label_widget.setText(
+            # Sub-pixel drags usually leave the rounded text unchanged
+            set_label_text(
+                self.label_widget,
                 f"{t1}: {pos1:.0f}, {t2}: {center:.0f}, {t3}: {pos2:.0f}",
                 size=DEFAULT_LABEL_SIZE
             )
@@ -241,51 +279,81 @@ class AveragingLineManager(QtCore.QObject):
             # Be tolerant if label widget is missing features
             pass
     
-    def _update_lines_and_emit(self, source_line=None) -> None:
-        """Update line positions and emit region changed signal."""
-        if not self.has_lines():
+    def _recompute_positions(self, source_line=None) -> Tuple[float, float, float]:
+        """Return the constrained (pos1, center, pos2) after source_line was moved."""
+        line1, line2 = self.line1, self.line2
+        current_pos1 = float(line1.value())
+        current_pos2 = float(line2.value())
+
+        # Ensure width can fit in data range (_bounded_width applies MIN_LINE_DISTANCE)
+        width = self._bounded_width(current_pos2 - current_pos1)
+
+        # Determine desired center based on which line moved
+        if source_line is line1:
+            desired_center = self._clamp_position(current_pos1) + width / 2.0
+        elif source_line is line2:
+            desired_center = self._clamp_position(current_pos2) - width / 2.0
+        else:
+            desired_center = float(self.center_line.value())
+
+        return self._constrain_region(desired_center, width)
+
+    def _on_line_moved(self, line) -> None:
+        """Slot for sigPositionChanged of the averaging lines while they are dragged."""
+        self._update_lines_and_emit(source_line=line, throttle=True)
+
+    def _update_lines_and_emit(self, source_line=None, throttle: bool = False) -> None:
+        """Update line positions and emit region changed signal.
+
+        Args:
+            source_line: The line that was moved (decides which edge is kept)
+            throttle: Defer the emission to the rate-limit timer (used while dragging)
+        """
+        if self._updating:
+            return
+        line1, line2, center_line = self.line1, self.line2, self.center_line
+        if line1 is None or line2 is None or center_line is None:
             return
         
-        # Block signals to prevent recursion
-        self.line1.blockSignals(True)
-        self.line2.blockSignals(True)
-        self.center_line.blockSignals(True)
-        
+        # Guard against recursion from the setValue calls below
+        self._updating = True
         try:
-            current_pos1 = float(self.line1.value())
-            current_pos2 = float(self.line2.value())
-            current_center = float(self.center_line.value())
-            current_width = max(MIN_LINE_DISTANCE, float(current_pos2 - current_pos1))
-
-            # Ensure width can fit in data range
-            width = self._bounded_width(current_width)
-
-            # Determine desired center based on which line moved
-            if source_line is self.line1:
-                desired_center = self._clamp_position(current_pos1) + width / 2.0
-            elif source_line is self.line2:
-                desired_center = self._clamp_position(current_pos2) - width / 2.0
-            elif source_line is self.center_line:
-                desired_center = current_center
-            else:
-                desired_center = current_center
-
-            new_pos1, new_center, new_pos2 = self._constrain_region(desired_center, width)
+            new_pos1, new_center, new_pos2 = self._recompute_positions(source_line)
 
             # Update line positions
-            self.line1.setValue(new_pos1)
-            self.line2.setValue(new_pos2)
-            self.center_line.setValue(new_center)
-
-            # Emit constrained positions
-            self.regionChanged.emit(new_pos1, new_center, new_pos2, self.stokes_index)
+            line1.setValue(new_pos1)
+            line2.setValue(new_pos2)
+            center_line.setValue(new_center)
 
             # Update label
             self._update_label(new_pos1, new_center, new_pos2)
         finally:
-            self.line1.blockSignals(False)
-            self.line2.blockSignals(False)
-            self.center_line.blockSignals(False)
+            self._updating = False
+
+        if not throttle:
+            self._emit_timer.stop()
+            self._emit_positions(new_pos1, new_center, new_pos2)
+        elif not self._emit_timer.isActive():
+            self._emit_timer.start(REGION_EMIT_INTERVAL_MS)
+
+    def _emit_region(self) -> None:
+        """Emit regionChanged with the current (already constrained) line positions."""
+        positions = self.get_positions()
+        if positions is None:
+            return
+        self._emit_positions(*positions)
+
+    def _emit_positions(self, pos1: float, center: float, pos2: float) -> None:
+        """Emit regionChanged unless these exact positions were the last ones sent.
+
+        Dragging against a data edge keeps the clamped region fixed, so the
+        repeated emissions would only redo the same averages downstream.
+        """
+        positions = (pos1, center, pos2)
+        if positions == self._last_emitted:
+            return
+        self._last_emitted = positions
+        self.regionChanged.emit(pos1, center, pos2, self.stokes_index)
 
     def create_from_span(self, start: float, end: float) -> None:
         """Convenience to create a region from two positions (mouse drag span)."""
@@ -295,42 +363,38 @@ class AveragingLineManager(QtCore.QObject):
         self.create_default_lines(center_pos=center, width=width)
 
     # --- Preview span handling (temp dashed lines) ---
+    # The two dashed preview lines are created on first use and then only
+    # hidden and shown again, so a drag does not add or remove scene items.
     def _remove_preview_lines(self) -> None:
-        if self._temp_line_press is not None:
-            try:
-                self.plot_item.removeItem(self._temp_line_press)
-            except Exception:
-                pass
-            self._temp_line_press = None
-        if self._temp_line_drag is not None:
-            try:
-                self.plot_item.removeItem(self._temp_line_drag)
-            except Exception:
-                pass
-            self._temp_line_drag = None
+        """Hide the preview lines."""
+        for line in (self._temp_line_press, self._temp_line_drag):
+            if line is not None:
+                line.setVisible(False)
+
+    def _show_preview_line(self, line: Optional[pg.InfiniteLine], pos: float) -> pg.InfiniteLine:
+        """Move a preview line to pos and show it, creating it if needed."""
+        if line is None:
+            return add_line(self.plot_item, self.color, self.angle, pos=pos, style=DASH_LINE)
+        line.setValue(pos)
+        line.setVisible(True)
+        return line
 
     def begin_drag_at(self, pos: float) -> None:
         """Start a preview drag at given position (axis depends on orientation)."""
         self._drag_start_pos = float(pos)
         self._remove_preview_lines()
-        colors = getWidgetColors()
-        color = colors.get(self.color_key, 'yellow')
         # DashLine preview at start position
-        self._temp_line_press = add_line(self.plot_item, color, self.angle, pos=self._drag_start_pos, style=DASH_LINE)
+        self._temp_line_press = self._show_preview_line(self._temp_line_press, self._drag_start_pos)
 
     def update_drag_to(self, pos: float) -> None:
         """Update preview to current position by drawing/moving second dashed line."""
         current_pos = float(pos)
-        colors = getWidgetColors()
-        color = colors.get(self.color_key, 'yellow')
-        if self._temp_line_drag is not None:
-            # Remove and recreate to keep it simple and consistent with window code
-            try:
-                self.plot_item.removeItem(self._temp_line_drag)
-            except Exception:
-                pass
-            self._temp_line_drag = None
-        self._temp_line_drag = add_line(self.plot_item, color, self.angle, pos=current_pos, style=DASH_LINE)
+        line = self._temp_line_drag
+        if line is not None and line.isVisible():
+            # Move the visible preview line; nothing else changes per mouse move
+            line.setValue(current_pos)
+            return
+        self._temp_line_drag = self._show_preview_line(line, current_pos)
 
     def end_drag_at(self, pos: float) -> None:
         """Finish the preview drag, create region from span, and clear preview."""
@@ -5,24 +5,39 @@ This module provides color schemes, theme management, and color utility function
 for consistent styling across the application.
 """
 
-from typing import Dict
+from functools import lru_cache
+from typing import Mapping
 from .constants import ColorSchemes
 
+# Theme name -> read-only color table, built once at import
+_COLOR_SCHEMES = {
+    'dark': ColorSchemes.DARK_THEME,
+    'light': ColorSchemes.LIGHT_THEME
+}
 
-def get_widget_colors(theme: str = 'dark') -> Dict[str, str]:
-    """Get widget colors for the specified theme."""
-    color_schemes = {
-        'dark': ColorSchemes.DARK_THEME,
-        'light': ColorSchemes.LIGHT_THEME
-    }
-    return color_schemes.get(theme, color_schemes['dark']).copy()
 
-def getWidgetColors(theme: str = 'dark') -> Dict[str, str]:
+@lru_cache(maxsize=None)
+def get_widget_colors(theme: str = 'dark') -> Mapping[str, str]:
+    """Get widget colors for the specified theme.
+
+    The theme tables are read-only mappings shared by all widgets, so they are
+    returned directly without a copy.
+    """
+    return _COLOR_SCHEMES.get(theme, ColorSchemes.DARK_THEME)
+
+def getWidgetColors(theme: str = 'dark') -> Mapping[str, str]:
     """Get widget colors for the specified theme."""
     return get_widget_colors(theme)
 
 
+@lru_cache(maxsize=1)
+def get_dark_stylesheet() -> str:
+    """Load the qdarkstyle stylesheet once and reuse it for every viewer window."""
+    import qdarkstyle
+    return qdarkstyle.load_stylesheet_from_environment(is_pyqtgraph=True)
+
+
 # Export commonly used functions
 __all__ = [
-    'getWidgetColors'
+    'getWidgetColors', 'get_dark_stylesheet'
 ]
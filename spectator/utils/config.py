@@ -1,6 +1,7 @@
+import copy
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 # Repo-local config path (preferred)
 _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
@@ -23,6 +24,22 @@ _DEFAULTS: Dict[str, Any] = {
 }
 
 
+# Last parsed config and the (mtime, size) stamps of the files it was read from
+_config_cache: Dict[str, Any] = {"stamp": None, "config": None}
+
+# Set once ensure_example_config has made sure a config file exists
+_example_config_checked = False
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def load_config() -> Dict[str, Any]:
     """Load spectator config with defaults.
 
@@ -30,10 +47,28 @@ def load_config() -> Dict[str, Any]:
     1) User-local: ~/.config/spectator/file_config.json
     2) Repo-local: REPO/config/file_config.json
 
+    The files are only re-read when one of them changed since the last call.
+
     Returns:
         dict: Merged config with defaults applied for missing keys.
     """
-    cfg: Dict[str, Any] = dict(_DEFAULTS)
+    stamp = (_file_stamp(USER_CONFIG_PATH), _file_stamp(REPO_CONFIG_PATH))
+    if _config_cache["config"] is None or _config_cache["stamp"] != stamp:
+        _config_cache["config"] = _read_config()
+        _config_cache["stamp"] = stamp
+    # Callers get their own copy and may modify it freely
+    return copy.deepcopy(_config_cache["config"])
+
+
+def invalidate_config_cache() -> None:
+    """Force the next load_config call to re-read the config files."""
+    _config_cache["config"] = None
+    _config_cache["stamp"] = None
+
+
+def _read_config() -> Dict[str, Any]:
+    """Read and merge the config files (see load_config for precedence)."""
+    cfg: Dict[str, Any] = copy.deepcopy(_DEFAULTS)
 
     # 1) User config under ~/.config/spectator
     try:
@@ -62,12 +97,19 @@ def load_config() -> Dict[str, Any]:
 
 
 def ensure_example_config():
-    """Create a skeleton repo-local file_config.json if none exists (non-intrusive)."""
+    """Create a skeleton repo-local file_config.json if none exists (non-intrusive).
+
+    The check runs once per session; later calls return immediately.
+    """
+    global _example_config_checked
+    if _example_config_checked:
+        return
     try:
         os.makedirs(REPO_CONFIG_DIR, exist_ok=True)
         if not os.path.isfile(REPO_CONFIG_PATH):
             with open(REPO_CONFIG_PATH, "w", encoding="utf-8") as f:
                 json.dump(_DEFAULTS, f, indent=2)
+        _example_config_checked = True
     except Exception:
         # Ignore errors silently
         pass
@@ -5,6 +5,7 @@ This module contains all the constant values, color schemes, and configuration
 parameters used throughout the application.
 """
 
+from types import MappingProxyType
 from typing import Dict, List, Tuple
 import os
 
@@ -35,9 +36,8 @@ DEFAULT_FONT_SIZE = '6pt'
 DEFAULT_LABEL_SIZE = '7pt'
 DEFAULT_TICK_FONT_SIZE = 8  # Font size for axis tick labels
 
-# Import QtGui for font object
-from pyqtgraph.Qt import QtGui
-TICK_FONT = QtGui.QFont('Arial', DEFAULT_TICK_FONT_SIZE)
+# TICK_FONT (a QtGui.QFont) is created on first access by __getattr__ below, so
+# importing the constants does not require Qt
 
 # Viewer / data limits
 MAX_STATES = 8
@@ -46,7 +46,8 @@ MAX_SPATIAL_AXES = 2
 # Data validation constants
 MIN_DATA_DIMENSION = 1
 MAX_DATA_DIMENSION = 5
-DEFAULT_DATA_TYPE = 'float64'
+# Single precision is ample for display data and halves memory and upload bandwidth
+DEFAULT_DATA_TYPE = 'float32'
 
 # UI layout constants
 DEFAULT_DOCK_SIZE = (400, 300)
@@ -88,9 +89,9 @@ def get_initial_window_size(app, *,
 
 # Color scheme definitions
 class ColorSchemes:
-    """Predefined color schemes for the application."""
+    """Predefined color schemes for the application (read-only mappings)."""
     
-    DARK_THEME = {
+    DARK_THEME = MappingProxyType({
         'background': '#19232D',
         'foreground': '#FFFFFF',
         'accent': '#375A7F',
@@ -101,9 +102,9 @@ class ColorSchemes:
         'averaging_spatial_y': '#2ecc71',
         'hover_averaging': 'orange',
         'hover_default': 'red'
-    }
+    })
     
-    LIGHT_THEME = {
+    LIGHT_THEME = MappingProxyType({
         'background': '#FFFFFF',
         'foreground': '#000000',
         'accent': '#0078D4',
@@ -114,7 +115,7 @@ class ColorSchemes:
         'averaging_spatial_y': '#27ae60',
         'hover_averaging': 'orange',
         'hover_default': 'red'
-    }
+    })
 
 # Gray color palette (from existing getWidgetColors.py)
 class GrayPalette:
@@ -180,3 +181,12 @@ __all__ = [
     'get_initial_window_size',
     'get_default_min_line_distance'
 ]
+
+
+def __getattr__(name):
+    if name == 'TICK_FONT':
+        from pyqtgraph.Qt import QtGui
+        font = QtGui.QFont('Arial', DEFAULT_TICK_FONT_SIZE)
+        globals()['TICK_FONT'] = font
+        return font
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,14 +7,15 @@ and transformation operations.
 
 import numpy as np
 from typing import Tuple, Optional, List, Union
-from .constants import DEFAULT_N_STOKES, DEFAULT_N_WL, DEFAULT_N_X
+from .constants import DEFAULT_N_STOKES, DEFAULT_N_WL, DEFAULT_N_X, DEFAULT_DATA_TYPE
 
 
 def generate_example_data_3d(n_stokes: int = DEFAULT_N_STOKES,
                          n_wl: int = DEFAULT_N_WL, 
                          n_x: int = DEFAULT_N_X,
                          add_noise: bool = True,
-                         noise_level: float = 0.1) -> np.ndarray:
+                         noise_level: float = 0.1,
+                         dtype: Union[str, np.dtype] = DEFAULT_DATA_TYPE) -> np.ndarray:
     """
     Generate example Stokes spectropolarimetric data with defined structure.
     
@@ -24,40 +25,50 @@ def generate_example_data_3d(n_stokes: int = DEFAULT_N_STOKES,
         n_x: Number of spatial points
         add_noise: Whether to add random noise
         noise_level: Relative noise level (0.0 to 1.0)
-        
+        dtype: Floating point type of the returned cube (float32 or float64)
+
     Returns:
         Stokes data cube of shape (n_stokes, n_wl, n_x)
     """
+    rng = np.random.default_rng()
+    dtype = np.dtype(dtype)
+
     # Initialize data with random noise using actual parameters
-    data = np.random.random(size=(n_stokes, n_wl, n_x)) * 5
+    data = rng.random((n_stokes, n_wl, n_x), dtype=dtype)
+    data *= 5
 
     # Define Gaussian parameters for Stokes I
     center_wl, center_x = n_wl // 2, n_x // 2
     width_wl, width_x = n_wl // 10, n_x // 8
 
-    # Create 2D spatial Gaussian and add to Stokes I
-    yy, xx = np.mgrid[:n_wl, :n_x]
-    spatial_gaussian = np.exp(-(((xx - center_x) / width_x) ** 2) / 2)
-    data[0] += 100000 * spatial_gaussian
+    # Spatial Gaussian (varies along x only) and spectral Gaussian profiles
+    spatial_gaussian = np.exp(-(((np.arange(n_x) - center_x) / width_x) ** 2) / 2).astype(dtype)
+    spectral_gaussian = np.exp(-((np.arange(n_wl) - center_wl) / width_wl) ** 2 / 2).astype(dtype)
 
-    # Create 1D spectral Gaussian and apply to Stokes I
-    spectral_gaussian = np.exp(-((np.arange(n_wl) - center_wl) / width_wl) ** 2 / 2)
-    data[0] *= spectral_gaussian[:, np.newaxis]
+    # Add the spatial Gaussian to Stokes I and apply the spectral Gaussian in place
+    stokes_i = data[0]
+    stokes_i += 100000 * spatial_gaussian
+    stokes_i *= spectral_gaussian[:, np.newaxis]
     # Only add to second Stokes parameter if it exists
     if n_stokes > 1:
         data[1, center_wl, center_x - 5 : center_x + 5] += 3
         data[1] *= 0.0000001
-    # Add noise if requested
+    # Add noise if requested, one state at a time through a reused buffer
         if add_noise and noise_level > 0:
-            noise = np.random.normal(0, noise_level * np.mean(data[1]), data.shape)
-            data += noise
+            scale = noise_level * np.mean(data[1])
+            noise = np.empty((n_wl, n_x), dtype=dtype)
+            for state in data:
+                rng.standard_normal(dtype=dtype, out=noise)
+                noise *= scale
+                state += noise
     
     return data
 
 def generate_example_data_4d():
     S, L, Y, X = 2, 100, 40, 80
     rng = np.random.default_rng(0)
-    data = rng.normal(scale=0.05, size=(S, L, Y, X)).astype(float)
+    # normal() already returns float64, so no astype copy of the 4D cube is needed
+    data = rng.normal(scale=0.05, size=(S, L, Y, X))
     # Axes
     x = np.linspace(-1, 1, X)        # spatial_x
     y = np.linspace(-1, 1, Y)        # spatial_y
@@ -69,8 +80,10 @@ def generate_example_data_4d():
     line_profile = np.exp(-((lam - 600.0) ** 2) / (2 * 30.0**2))  # (L,)
     # Outer product to get (L, Y, X)
     feature = line_profile[:, None, None] * spatial_bump[None, :, :]  # (L, Y, X)
-    # Add feature to each state with different scaling
+    # Add feature to each state with different scaling, reusing one (L, Y, X) buffer
+    scaled_feature = np.empty_like(feature)
     for s in range(S):
-        data[s] += (1.0 + 0.5 * s) * feature
+        np.multiply(feature, 1.0 + 0.5 * s, out=scaled_feature)
+        data[s] += scaled_feature
 
     return data
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+File system utilities for the spectral data viewer.
+
+This module contains helpers for locating data files below a directory.
+"""
+
+import os
+from typing import Iterator, List, Tuple
+
+
+def walk_files(top: str, suffix: str) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Walk a directory tree and yield the files with a given suffix per directory.
+
+    Equivalent to filtering os.walk(top) by file suffix, in the same top-down
+    order, but file names are filtered while the directory is scanned and
+    directories without a matching file are not yielded, so no per-directory
+    lists of unrelated entries are built. Symbolic links to directories are not
+    followed, as with os.walk.
+
+    Args:
+        top: Directory to start from
+        suffix: File name suffix to match (e.g. '.dat')
+
+    Yields:
+        Tuples of (directory, file names ending in suffix)
+    """
+    stack = [top]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        files = []
+        subdirs = []
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    if entry.name.endswith(suffix):
+                        files.append(entry.name)
+                    continue
+                try:
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+        if files:
+            yield directory, files
+        # Reversed so the first subdirectory is visited next, as in os.walk
+        stack.extend(reversed(subdirs))
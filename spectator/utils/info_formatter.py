@@ -1,8 +1,26 @@
 from __future__ import annotations
 from typing import Iterable, Mapping, Any, Tuple, List, Dict
 import ast
+from collections import defaultdict
 import html
 import re
+from operator import itemgetter
+
+# Sort key for (name, value) pairs: by name only, keeping input order for ties
+_first = itemgetter(0)
+
+# Quote characters left over from Python repr()s of the raw info lines
+_QUOTES = ("'", '"')
+
+# "key', b'value" / "key', 'value" lines (see _split_param_value)
+_QUOTED_PAIR_RE = re.compile(r"^\s*([^,:=\t]+?)['\"]\s*,\s*b?['\"](.*)$")
+
+
+def _escape(s: str) -> str:
+    """html.escape(s), returning s itself when it has nothing to escape."""
+    if '&' in s or '<' in s or '>' in s or '"' in s or "'" in s:
+        return html.escape(s)
+    return s
 
 
 def _split_param_value(line: str) -> Tuple[str, str]:
@@ -14,19 +32,21 @@ def _split_param_value(line: str) -> Tuple[str, str]:
         return "", ""
     # Special-case: patterns like "key', b'value" or "key', 'value"
     # Capture minimal key (no separators) followed by a quote, comma, optional b, then quoted/partial value
-    m = re.match(r"^\s*([^,:=\t]+?)['\"]\s*,\s*b?['\"](.*)$", s)
-    if m:
-        left, right = m.group(1), m.group(2)
-        return left.strip(), right.strip()
+    # The pattern needs a quote before the comma, so unquoted lines skip the regex
+    if "'" in s or '"' in s:
+        m = _QUOTED_PAIR_RE.match(s)
+        if m:
+            left, right = m.group(1), m.group(2)
+            return left.strip(), right.strip()
 
     # Try common separators first
     for sep in (":", "=", "\t"):
         if sep in s:
-            left, right = s.split(sep, 1)
+            left, _, right = s.partition(sep)
             return left.strip(), right.strip()
     # As a last resort, consider a single comma as key/value separator
-    if "," in s and s.count(",") == 1:
-        left, right = s.split(",", 1)
+    if s.count(",") == 1:
+        left, _, right = s.partition(",")
         return left.strip(), right.strip()
     # Fallback: split on multiple spaces
     parts = s.split()
@@ -97,6 +117,10 @@ def _strip_py_bytes_literal(s: str) -> str:
     st = s.strip()
     # Complete bytes literal like b'abc' or b"abc"
     if len(st) >= 3 and (st.startswith("b'") and st.endswith("'") or st.startswith('b"') and st.endswith('"')):
+        # Without escapes or inner quotes the literal's text is just its body
+        body = st[2:-1]
+        if '\\' not in body and st[1] not in body:
+            return body
         try:
             val = ast.literal_eval(st)  # type: ignore[arg-type]
             if isinstance(val, (bytes, bytearray)):
@@ -138,16 +162,21 @@ def _strip_brackets_group(s: str) -> str:
 def _strip_artifacts(s: str) -> str:
     """Remove common artifacts: trailing ] directly after a quote and stray commas at end."""
     st = s.strip()
+    # Work on end indices and slice once at the end
+    end = len(st)
     # Remove trailing ], '], "] after a quoted token
-    if len(st) >= 2 and st[-1] == ']' and (len(st) >= 2 and (st[-2] == "'" or st[-2] == '"')):
-        st = st[:-1]
+    if end >= 2 and st[-1] == ']' and (st[-2] == "'" or st[-2] == '"'):
+        end -= 1
     # Remove trailing single comma (often used as delimiter in raw lines)
-    if st.endswith(','):
-        st = st[:-1]
+    if end and st[end - 1] == ',':
+        end -= 1
     # Remove surrounding quotes
-    if (len(st) >= 2 and ((st[0] == "'" and st[-1] == "'") or (st[0] == '"' and st[-1] == '"'))):
-        st = st[1:-1]
-    return st.strip()
+    start = 0
+    if end >= 2 and (st[0] == "'" or st[0] == '"') and st[end - 1] == st[0]:
+        start, end = 1, end - 1
+    if start == 0 and end == len(st):
+        return st
+    return st[start:end].strip()
 
 
 def format_info_to_html(info: Any) -> str:
@@ -162,14 +191,15 @@ def format_info_to_html(info: Any) -> str:
     Returns a full HTML snippet including minimal CSS for readability.
     """
     lines = _ensure_iterable_strings(info)
+    # Clean every line once; the loop and the two-line lookahead read from here
+    cleaned = [_strip_artifacts(_strip_py_bytes_literal(raw.strip())) for raw in lines]
 
-    groups: Dict[str, List[Tuple[str, str]]] = {}
+    groups: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
     current_group: str | None = None
     i = 0
-    n = len(lines)
+    n = len(cleaned)
     while i < n:
-        raw = lines[i]
-        s = _strip_artifacts(_strip_py_bytes_literal(raw.strip()))
+        s = cleaned[i]
         if not s:
             i += 1
             continue
@@ -196,7 +226,7 @@ def format_info_to_html(info: Any) -> str:
             j = i + 1
             val = ''
             while j < n:
-                nxt = _strip_artifacts(_strip_py_bytes_literal(lines[j].strip()))
+                nxt = cleaned[j]
                 j += 1
                 if nxt:
                     val = nxt
@@ -211,23 +241,22 @@ def format_info_to_html(info: Any) -> str:
         # Clean any bytes-literal looking values
         val = _strip_py_bytes_literal(val)
         val = _strip_artifacts(val.strip())
-        if val.endswith("'") or val.endswith('"'):
+        if val.endswith(_QUOTES):
             val = val[:-1].strip()
 
         # Determine group and subkey
         group: str
         sub: str
-        if '.' in key:
-            group, sub = key.split('.', 1)
-        else:
+        group, dot, sub = key.partition('.')
+        if not dot:
             group = current_group or 'misc'
             sub = key
         group = _strip_brackets_group(group.strip()) or 'misc'
         # Clean subkey: remove artifacts and any stray trailing quote
         sub = _strip_artifacts(sub.strip())
-        if sub.endswith("'") or sub.endswith('"'):
+        if sub.endswith(_QUOTES):
             sub = sub[:-1].strip()
-        groups.setdefault(group, []).append((sub, val))
+        groups[group].append((sub, val))
 
     # Sort groups and keys for stable layout
     html_parts: List[str] = [essential_css, '<div class="info-root">']
@@ -235,15 +264,14 @@ def format_info_to_html(info: Any) -> str:
     if not groups:
         html_parts.append('<div class="dim">No info entries.</div>')
     else:
-        for gname in sorted(groups.keys()):
-            html_parts.append(f'<div class="group-title">{html.escape(gname)}</div>')
+        escape = _escape
+        for gname, entries in sorted(groups.items(), key=_first):
+            html_parts.append(f'<div class="group-title">{escape(gname)}</div>')
             html_parts.append('<table class="info">')
-            for sub, val in sorted(groups[gname], key=lambda kv: kv[0]):
-                key_html = html.escape(sub)
-                val_html = html.escape(val)
-                html_parts.append(
-                    f'<tr><td class="key">{key_html}</td><td class="val">{val_html}</td></tr>'
-                )
+            html_parts.extend(
+                f'<tr><td class="key">{escape(sub)}</td><td class="val">{escape(val)}</td></tr>'
+                for sub, val in sorted(entries, key=_first)
+            )
             html_parts.append('</table>')
 
     html_parts.append('</div>')
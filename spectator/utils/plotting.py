@@ -5,9 +5,13 @@ This module contains helper functions for creating and configuring PyQtGraph
 plot items, crosshairs, histograms, and other plotting elements.
 """
 
+import importlib
+import math
 import numpy as np
 import pyqtgraph as pg
-from pyqtgraph.Qt import QtCore, QtWidgets
+from dataclasses import dataclass
+from functools import lru_cache
+from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 from typing import Tuple, Optional
 
 from .constants import DEFAULT_LINE_WIDTH, DEFAULT_FONT_SIZE, DEFAULT_LABEL_SIZE, TICK_FONT, ColorSchemes
@@ -32,6 +36,47 @@ def _to_superscript(num: int) -> str:
     return ''.join(_SUPERSCRIPT_MAP.get(c, c) for c in str(num))
 
 
+@lru_cache(maxsize=64)
+def line_pen(color: str, width: float = DEFAULT_LINE_WIDTH, style=SOLID_LINE) -> QtGui.QPen:
+    """
+    Return the pen for a color, width and style, built once per combination.
+    
+    pyqtgraph copies pens passed to setPen/setHoverPen and only reads the pen a
+    PlotDataItem is created with, so one instance can be shared; callers must
+    not modify it.
+    
+    Args:
+        color: Line color
+        width: Line width
+        style: Line style (Qt pen style)
+        
+    Returns:
+        Shared QPen
+    """
+    return pg.mkPen(color, width=width, style=style)
+
+
+@lru_cache(maxsize=None)
+def _scale_label_text(factor: float) -> str:
+    """Return the histogram unit label (1/factor as a power of ten) for a scale factor."""
+    if factor == 1.0:
+        return "1"
+    inverse_factor = 1.0 / factor
+    exponent = int(math.log10(abs(inverse_factor))) if inverse_factor != 0 else 0
+    if exponent != 0:
+        return f"10{_to_superscript(exponent)}"
+    return "1"
+
+
+@lru_cache(maxsize=1)
+def _app_controller_module():
+    """Import the module holding the global data manager once; None if unavailable."""
+    try:
+        return importlib.import_module('controllers.app_controller')
+    except ImportError:
+        return None
+
+
 def add_line(plot_item: pg.PlotItem, 
              color: str, 
              angle: float, 
@@ -54,17 +99,18 @@ def add_line(plot_item: pg.PlotItem,
     Returns:
         The created InfiniteLine object
     """
-    line = pg.InfiniteLine(pos=pos, angle=angle, movable=moveable)
-    line.setPen(color, width=DEFAULT_LINE_WIDTH, style=style)
-    
     # Set custom hover pen based on line type
+    hover_pen = None
     if moveable:
         colors = getWidgetColors()
         if is_averaging_line and style == SOLID_LINE:
-            hover_pen = pg.mkPen(color=colors.get('hover_averaging', 'orange'), width=DEFAULT_LINE_WIDTH + 1, style=style)
+            hover_pen = line_pen(colors.get('hover_averaging', 'orange'), DEFAULT_LINE_WIDTH + 1, style)
         else:
-            hover_pen = pg.mkPen(color=colors.get('hover_default', 'red'), width=DEFAULT_LINE_WIDTH + 1, style=style)
-        line.setHoverPen(hover_pen)
+            hover_pen = line_pen(colors.get('hover_default', 'red'), DEFAULT_LINE_WIDTH + 1, style)
+    
+    # Pens are passed to the constructor so it does not build its default pens first
+    line = pg.InfiniteLine(pos=pos, angle=angle, movable=moveable,
+                           pen=line_pen(color, DEFAULT_LINE_WIDTH, style), hoverPen=hover_pen)
     
     plot_item.addItem(line, ignoreBounds=True)
     return line
@@ -91,27 +137,31 @@ def add_crosshair(plot_item: pg.PlotItem,
     return v_line, h_line
 
 
+@lru_cache(maxsize=1024)
+def _format_tick(v: float) -> str:
+    """Format one tick value, using scientific notation for very small/large values.
+    
+    Tick values are round numbers that recur while panning and zooming, so the
+    strings are cached.
+    """
+    if v == 0:
+        return '0'
+    abs_val = abs(v)
+    # Use scientific notation for very small or very large values
+    if abs_val < 1e-3 or abs_val >= 1e4:
+        return f'{v:.1e}'
+    if abs_val >= 1:
+        return f'{v:.3g}'
+    # Format small decimals nicely
+    return f'{v:.4f}'.rstrip('0').rstrip('.')
+
+
 class ScientificAxisItem(pg.AxisItem):
     """Custom axis item that uses scientific notation for very small/large values."""
     
     def tickStrings(self, values, scale, spacing):
         """Override tick string formatting to use scientific notation when appropriate."""
-        strings = []
-        for v in values:
-            if v == 0:
-                strings.append('0')
-            else:
-                abs_val = abs(v)
-                # Use scientific notation for very small or very large values
-                if abs_val < 1e-3 or abs_val >= 1e4:
-                    strings.append(f'{v:.1e}')
-                elif abs_val >= 1:
-                    strings.append(f'{v:.3g}')
-                else:
-                    # Format small decimals nicely
-                    formatted = f'{v:.4f}'.rstrip('0').rstrip('.')
-                    strings.append(formatted)
-        return strings
+        return [_format_tick(v) for v in values]
 
 
 def create_histogram_with_scaling(image_item: pg.ImageItem, 
@@ -131,19 +181,21 @@ def create_histogram_with_scaling(image_item: pg.ImageItem,
     container_layout.setContentsMargins(0, 0, 0, 0)
     container_layout.setSpacing(2)
     
+    colors = getWidgetColors()
+    background = colors.get('background', '#19232D')
+    
     # Create the histogram
     histogram = pg.HistogramLUTWidget()
     histogram.setImageItem(image_item)
-    histogram.setBackground(getWidgetColors().get('background', '#19232D'))
+    histogram.setBackground(background)
     histogram.setFixedWidth(60)
     
     # Create a label for the scale factor
     scale_label = QtWidgets.QLabel("1")  # Start with "1" instead of empty string
-    colors = getWidgetColors()
     scale_label.setStyleSheet(f"""
         QLabel {{
             color: {colors.get('foreground', '#FFFFFF')};
-            background-color: {colors.get('background', '#19232D')};
+            background-color: {background};
             font-size: {DEFAULT_LABEL_SIZE};
             font-weight: normal;
             padding: 2px;
@@ -167,9 +219,8 @@ def create_histogram_with_scaling(image_item: pg.ImageItem,
             # If no scale_info provided, try to get it from global data manager
             if not current_scale_info:
                 try:
-                    from controllers.app_controller import data_manager
-                    current_scale_info = data_manager.get_current_scale_info()
-                except (ImportError, AttributeError):
+                    current_scale_info = _app_controller_module().data_manager.get_current_scale_info()
+                except AttributeError:
                     current_scale_info = None
             
             # Default to "1" - this ensures we always show something
@@ -177,41 +228,16 @@ def create_histogram_with_scaling(image_item: pg.ImageItem,
             
             # Use scaling info from data model if available
             if current_scale_info and isinstance(current_scale_info, dict):
-                labels = current_scale_info.get('labels', {})
                 factors = current_scale_info.get('factors', {})
                 
-                # Use state-specific scaling if stokes_index is provided
+                # Always calculate from factors to show 1/factor (units), ignore pre-existing labels
                 if stokes_index is not None:
-                    # Always calculate from factors to show 1/factor (units), ignore pre-existing labels
+                    # Use state-specific scaling; without info for this state the label remains "1"
                     if factors and stokes_index in factors:
-                        # Create label from 1/factor for this specific state (to show units)
-                        factor = factors[stokes_index]
-                        if factor == 1.0:
-                            label_text = "1"
-                        else:
-                            # Convert 1/factor to scientific notation label with superscript
-                            inverse_factor = 1.0 / factor
-                            exponent = int(np.log10(abs(inverse_factor))) if inverse_factor != 0 else 0
-                            if exponent != 0:
-                                label_text = f"10{_to_superscript(exponent)}"
-                            else:
-                                label_text = "1"
-                    # If no scaling info for this state, label_text remains "1"
-                else:
-                    # No stokes_index provided, always calculate from factors to show 1/factor (units)
-                    if factors:
-                        # Create a simple label from 1/factor, ignore pre-existing labels
-                        first_factor = next(iter(factors.values()), 1.0)
-                        if first_factor == 1.0:
-                            label_text = "1"
-                        else:
-                            # Convert 1/factor to scientific notation label with superscript
-                            inverse_factor = 1.0 / first_factor
-                            exponent = int(np.log10(abs(inverse_factor))) if inverse_factor != 0 else 0
-                            if exponent != 0:
-                                label_text = f"10{_to_superscript(exponent)}"
-                            else:
-                                label_text = "1"
+                        label_text = _scale_label_text(factors[stokes_index])
+                elif factors:
+                    # No stokes_index provided, use the first factor
+                    label_text = _scale_label_text(next(iter(factors.values()), 1.0))
  
             scale_label.setText(label_text)
                 
@@ -222,8 +248,10 @@ def create_histogram_with_scaling(image_item: pg.ImageItem,
     # Update scale label initially
     update_scale_label()
     
-    # Connect to image item signals to update scale label when data changes
-    if hasattr(image_item, 'sigImageChanged'):
+    # The label depends only on the scale factors, not on the image values, so
+    # it only needs refreshing on image changes when the factors come from the
+    # global data manager (which may rescale) rather than a fixed scale_info
+    if not scale_info and hasattr(image_item, 'sigImageChanged'):
         image_item.sigImageChanged.connect(update_scale_label)
     
     # Store update function for later use
@@ -241,6 +269,19 @@ def create_histogram(image_item: pg.ImageItem,
     histogram, scale_label = create_histogram_with_scaling(image_item, layout, scale_info, stokes_index)
     return histogram
 
+def _configure_axes(plot: pg.PlotItem):
+    """Apply the common tick font, SI prefix and size settings to the left, bottom and top axes."""
+    get_axis = plot.getAxis
+    for axis_name in ('left', 'bottom', 'top'):
+        axis = get_axis(axis_name)
+        axis.enableAutoSIPrefix(False)  # Disable auto SI prefix for all relevant axes
+        axis.setStyle(tickFont=TICK_FONT)
+        if axis_name == 'left':
+            axis.setWidth(30)
+        else:  # 'bottom' and 'top'
+            axis.setHeight(15)
+
+
 def initialize_image_plot_item(item: pg.PlotItem, 
                                y_values: bool = True,
                                x_label: str = "x",
@@ -258,15 +299,7 @@ def initialize_image_plot_item(item: pg.PlotItem,
         x_units: X-axis units
         y_units: Y-axis units
     """
-    # Configure axis properties
-    for axis_name in ['left', 'bottom', 'top']:
-        axis = item.getAxis(axis_name)
-        axis.enableAutoSIPrefix(False)  # Disable auto SI prefix for all relevant axes
-        axis.setStyle(tickFont=TICK_FONT)
-        if axis_name == 'left':
-            axis.setWidth(30)
-        else:  # 'bottom' and 'top'
-            axis.setHeight(15)
+    _configure_axes(item)
 
     item.setLabel("bottom", text=x_label, units=x_units)
     item.setLabel("left", text=y_label, units=y_units)
@@ -296,15 +329,7 @@ def initialize_spectrum_plot_item(plot: pg.PlotItem,
         x_units: X-axis units
         y_units: Y-axis units
     """
-    # Configure axis properties
-    for axis_name in ['left', 'bottom', 'top']:
-        axis = plot.getAxis(axis_name)
-        axis.enableAutoSIPrefix(False)  # Disable auto SI prefix for all relevant axes
-        axis.setStyle(tickFont=TICK_FONT)
-        if axis_name == 'left':
-            axis.setWidth(30)
-        else:  # 'bottom' and 'top'
-            axis.setHeight(15)
+    _configure_axes(plot)
 
     plot.setLabel("bottom", text=x_label, units=x_units)
     
@@ -325,6 +350,47 @@ def initialize_spectrum_plot_item(plot: pg.PlotItem,
     plot.setDefaultPadding(0.0)
 
 
+# Axis name -> (range setter method name, index into viewRange())
+_AXIS_RANGE_DISPATCH = {
+    'x': ('setXRange', 0),
+    'y': ('setYRange', 1),
+    'X': ('setXRange', 0),
+    'Y': ('setYRange', 1),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RangeLabel:
+    """
+    Immutable description of a range applied to one axis of a plot.
+
+    Two equal labels mean that re-applying the range would not change the
+    plot, so the redraw can be skipped.
+    """
+    min_val: float
+    max_val: float
+    data_id: int
+    axis: str
+    view_range: Tuple[float, float]
+
+
+def wavelength_extent(wavelength: np.ndarray) -> Tuple[float, float]:
+    """
+    Return the (min, max) of a monotonic wavelength axis from its end points.
+    
+    The spectral axes are sorted pixel/wavelength grids, so the extent is known
+    in O(1) without scanning the whole array.
+    
+    Args:
+        wavelength: Monotonic (ascending or descending) wavelength axis
+        
+    Returns:
+        Tuple of (min, max) values
+    """
+    first, last = float(wavelength[0]), float(wavelength[-1])
+    return (first, last) if first <= last else (last, first)
+
+
 def set_plot_wavelength_range(plot_widget: pg.PlotWidget, 
                              wavelength: np.ndarray, 
                              min_val: Optional[float] = None, 
@@ -335,26 +401,38 @@ def set_plot_wavelength_range(plot_widget: pg.PlotWidget,
     
     Args:
         plot_widget: PlotWidget to modify
-        wavelength: Wavelength array
+        wavelength: Sorted wavelength array
         min_val: Minimum wavelength value (None for auto)
         max_val: Maximum wavelength value (None for auto)
         axis: Axis to modify ('x' or 'y')
     """
+    full_min, full_max = wavelength_extent(wavelength)
     if min_val is None:
-        min_val = wavelength.min()
+        min_val = full_min
     if max_val is None:
-        max_val = wavelength.max()
+        max_val = full_max
     
     # Ensure valid range
     if min_val >= max_val:
-        min_val = wavelength.min()
-        max_val = wavelength.max()
+        min_val, max_val = full_min, full_max
     
+    dispatch = _AXIS_RANGE_DISPATCH.get(axis)
+    if dispatch is None:
+        return
+    setter_name, axis_idx = dispatch
+    axis = 'xy'[axis_idx]
+
+    # Skip the redraw if the same range was already applied and the view is unchanged
+    label = RangeLabel(float(min_val), float(max_val), id(wavelength), axis,
+                       tuple(plot_widget.viewRange()[axis_idx]))
+    if label == getattr(plot_widget, '_range_label', None):
+        return
+
     # Apply range based on axis
-    if axis.lower() == 'x':
-        plot_widget.setXRange(min_val, max_val, padding=0.02)
-    elif axis.lower() == 'y':
-        plot_widget.setYRange(min_val, max_val, padding=0.02)
+    getattr(plot_widget, setter_name)(min_val, max_val, padding=0.02)
+
+    plot_widget._range_label = RangeLabel(label.min_val, label.max_val, label.data_id, axis,
+                                          tuple(plot_widget.viewRange()[axis_idx]))
 
 
 def reset_plot_wavelength_range(plot_widget: pg.PlotWidget, 
@@ -365,16 +443,15 @@ def reset_plot_wavelength_range(plot_widget: pg.PlotWidget,
     
     Args:
         plot_widget: PlotWidget to reset
-        wavelength: Wavelength array
+        wavelength: Monotonic wavelength array
         axis: Axis to reset ('x' or 'y')
     """
-    min_val = wavelength.min()
-    max_val = wavelength.max()
+    dispatch = _AXIS_RANGE_DISPATCH.get(axis)
+    if dispatch is None:
+        return
     
-    if axis.lower() == 'x':
-        plot_widget.setXRange(min_val, max_val, padding=0.02)
-    elif axis.lower() == 'y':
-        plot_widget.setYRange(min_val, max_val, padding=0.02)
+    min_val, max_val = wavelength_extent(wavelength)
+    getattr(plot_widget, dispatch[0])(min_val, max_val, padding=0.02)
 
 
 def update_crosshair_from_mouse(plot_item: pg.PlotItem, 
@@ -393,14 +470,78 @@ def update_crosshair_from_mouse(plot_item: pg.PlotItem,
     Returns:
         Tuple of (x_pos, y_pos) if valid, None otherwise
     """
-    if plot_item.sceneBoundingRect().contains(pos):
-        mouse_point = plot_item.vb.mapSceneToView(pos)
-        v_line.setPos(mouse_point.x())
-        h_line.setPos(mouse_point.y())
-        return mouse_point.x(), mouse_point.y()
+    if _scene_rect(plot_item).contains(pos):
+        mouse_point = map_scene_to_view(plot_item.vb, pos)
+        x_pos, y_pos = mouse_point.x(), mouse_point.y()
+        v_line.setPos(x_pos)
+        h_line.setPos(y_pos)
+        return x_pos, y_pos
     return None
 
 
+def set_label_text(label: pg.LabelItem, text: str, **kwargs):
+    """
+    Set the text of a label, skipping the update if nothing would change.
+    
+    LabelItem.setText rebuilds the HTML and relayouts the item on every call,
+    which is wasted work while the mouse moves within the same pixel.
+    
+    Args:
+        label: LabelItem to update
+        text: New label text
+        **kwargs: Style arguments forwarded to LabelItem.setText
+    """
+    if label.text == text and all(label.opts.get(k) == v for k, v in kwargs.items()):
+        return
+    label.setText(text, **kwargs)
+
+
+def _scene_rect(plot_item: pg.PlotItem) -> QtCore.QRectF:
+    """
+    Return the scene bounding rect of a plot item, cached between geometry changes.
+    
+    sceneBoundingRect() maps the item geometry into the scene on every call,
+    which is repeated for each mouse move. The rect only changes when the plot
+    is resized or moved within its layout, which emits geometryChanged.
+    
+    Args:
+        plot_item: PlotItem whose scene rect is wanted
+        
+    Returns:
+        Bounding rect of the plot item in scene coordinates
+    """
+    rect = getattr(plot_item, '_cached_scene_rect', None)
+    if rect is None:
+        if not hasattr(plot_item, '_cached_scene_rect'):
+            plot_item.geometryChanged.connect(lambda: setattr(plot_item, '_cached_scene_rect', None))
+        rect = plot_item.sceneBoundingRect()
+        plot_item._cached_scene_rect = rect
+    return rect
+
+
+def map_scene_to_view(view_box: pg.ViewBox, pos: QtCore.QPointF) -> QtCore.QPointF:
+    """
+    Map a scene position into view coordinates using a cached inverse transform.
+    
+    ViewBox.mapSceneToView inverts the view transform on every call. The inverse
+    is cached on the view box and only recomputed when its scene transform changes.
+    
+    Args:
+        view_box: ViewBox whose view coordinates are wanted
+        pos: Position in scene coordinates
+        
+    Returns:
+        Position in view coordinates
+    """
+    view_box.updateMatrix()
+    scene_transform = view_box.childGroup.sceneTransform()
+    cached = getattr(view_box, '_cached_scene_to_view', None)
+    if cached is None or cached[0] != scene_transform:
+        cached = (scene_transform, pg.functions.invertQTransform(scene_transform))
+        view_box._cached_scene_to_view = cached
+    return cached[1].map(pos)
+
+
 def create_wavelength_limit_controls(name: str) -> Tuple[QtWidgets.QLabel, QtWidgets.QLineEdit, QtWidgets.QHBoxLayout]:
     """
     Create wavelength limit control widgets.
@@ -425,20 +566,6 @@ def create_wavelength_limit_controls(name: str) -> Tuple[QtWidgets.QLabel, QtWid
     
     return label, line_edit, layout
 
-def create_wavelength_limit_controls(name: str):
-    """Label for wavelength limits (overrides older duplicate)."""
-    wavelength_label = QtWidgets.QLabel(name)
-    try:
-        wavelength_label.setStyleSheet(f"font-size: {DEFAULT_LABEL_SIZE};")
-    except Exception:
-        pass
-    wavelength_edit = QtWidgets.QLineEdit()
-    wavelength_edit.setPlaceholderText("Optional")
-    layout = QtWidgets.QHBoxLayout()
-    layout.addWidget(wavelength_label)
-    layout.addWidget(wavelength_edit)
-    return (wavelength_label, wavelength_edit, layout)
-
 def create_y_limit_controls(name: str) -> Tuple[QtWidgets.QLabel, QtWidgets.QLineEdit, QtWidgets.QHBoxLayout]:
     """
     Create Y-axis limit control widgets.
@@ -6,10 +6,26 @@ and other plot interactions without code duplication.
 """
 
 import numpy as np
-from typing import List, Optional, Callable, Any
+from typing import List, Optional, Callable, Any, Tuple
 from pyqtgraph.Qt import QtCore
 
 
+def flush_connections(queue: List[Tuple[Any, Callable]]):
+    """
+    Connect and clear a list of queued (signal, slot) pairs.
+
+    Connecting many widgets while the window is still being built adds to the
+    startup time; viewers collect the pairs in a list and flush them after the
+    window has been shown.
+
+    Args:
+        queue: (signal, slot) tuples to connect; emptied afterwards
+    """
+    for signal, slot in queue:
+        signal.connect(slot)
+    queue.clear()
+
+
 class SynchronizationManager(QtCore.QObject):
     """
     Manages synchronization of plot interactions across multiple widget collections.
@@ -256,7 +272,7 @@ class SynchronizationManager(QtCore.QObject):
     
     def _convert_to_index(self, pos: float, max_val: int) -> int:
         """Convert position to array index with bounds checking."""
-        return np.clip(int(np.round(pos)), 0, max_val - 1)
+        return min(max(int(round(pos)), 0), max_val - 1)
     
     def _validate_source_index(self, source_index: int) -> bool:
         """Validate that source index is within bounds."""
@@ -11,9 +11,7 @@ from pyqtgraph.widgets.VerticalLabel import VerticalLabel as PgVerticalLabel
 from typing import Optional
 import warnings
 
-# Import our models for configuration
-from ..models import get_default_min_line_distance
-from ..utils.constants import DEFAULT_LABEL_SIZE
+from ..utils.constants import DEFAULT_LABEL_SIZE, get_default_min_line_distance
 from ..utils.colors import getWidgetColors
 
 
@@ -93,7 +91,6 @@ class BasePlotWidget(QtWidgets.QWidget):
         self.graphics_widget.setBackground(getWidgetColors().get('background', '#19232D'))
         self.plotItem = self.graphics_widget.addPlot(row=0, col=0, colspan=3)
         self.layout.addWidget(self.graphics_widget)
-        self.setLayout(self.layout)
         
         # Setup label
         self.label = pg.LabelItem(justify='left', size=DEFAULT_LABEL_SIZE)
@@ -104,10 +101,42 @@ class BasePlotWidget(QtWidgets.QWidget):
         self.current_x_idx = 0
         self.current_x_idx_avg = 0
         self.current_wl_idx_avg = 0
+        # Averaged profile; None while no averaging region is set. Kept as an
+        # attribute so hot paths test it directly instead of a (slow) hasattr miss
+        self.plot_data_avg = None
+        # Pixel of the last crosshair position sent to other windows
+        self._emitted_crosshair_pixel = None
         
         # Configuration
         self._setup_default_colors()
     
+    def _crosshair_pixel_changed(self, xpos: float, ypos: float) -> bool:
+        """
+        Check whether a crosshair position falls on a new data pixel.
+        
+        Receivers of crosshair signals round positions to pixel indices, so
+        sub-pixel mouse motion would only redo the same slicing and redraws.
+        
+        Args:
+            xpos: Crosshair x position in plot coordinates
+            ypos: Crosshair y position in plot coordinates
+            
+        Returns:
+            True if the pixel differs from the last emitted one (and records it)
+        """
+        pixel = (round(xpos), round(ypos))
+        if pixel == self._emitted_crosshair_pixel:
+            return False
+        self._emitted_crosshair_pixel = pixel
+        return True
+    
+    def leaveEvent(self, event):
+        """Forget the last emitted crosshair pixel once the mouse leaves the window."""
+        # Other windows may update the shared views while the mouse is elsewhere,
+        # so the next move in this window must be emitted even on the same pixel
+        self._emitted_crosshair_pixel = None
+        super().leaveEvent(event)
+    
     def _setup_default_colors(self):
         """Setup default color schemes from models."""
         self.min_line_distance = get_default_min_line_distance()
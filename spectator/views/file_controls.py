@@ -5,8 +5,10 @@ This module contains control panels for selecting and loading data files.
 """
 
 import os
+import re
 from pyqtgraph.Qt import QtCore, QtWidgets
-from scipy.io import readsav
+
+from ..utils.file_utils import walk_files
 
 
 class FilesControlWidget(QtWidgets.QWidget):
@@ -108,17 +110,17 @@ class FilesControlWidget(QtWidgets.QWidget):
         list_of_files = []
         list_of_directories = []
         
-        for root, dirs, files in os.walk(directories[0]):       
+        # One compiled alternation instead of a substring test per exclude term
+        exclude_pattern = re.compile('|'.join(map(re.escape, excludes))) if excludes else None
+        
+        for root, files in walk_files(directories[0], '.sav'):
+            if in_dir not in root:
+                continue
             for file in files:
-                if in_dir in root and file.endswith('.sav'):
-                    use = True
-                    for exclude in excludes:
-                        if exclude in file:
-                            use = False
-                            break
-                    if use:
-                        list_of_files.append(file)
-                        list_of_directories.append(root)
+                if exclude_pattern is not None and exclude_pattern.search(file):
+                    continue
+                list_of_files.append(file)
+                list_of_directories.append(root)
                  
         return list_of_files, list_of_directories
     
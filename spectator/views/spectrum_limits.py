@@ -141,7 +141,12 @@ class SpectrumLimitControlGroup(BaseControlWidget):
         try:
             img = widget.image_item.image
             if img is not None and img.size > 0:
-                return float(np.nanmin(img)), float(np.nanmax(img))
+                # Plain min/max skip the NaN handling of nanmin/nanmax; they
+                # can only return NaN for float images that contain NaNs
+                img_min, img_max = float(np.min(img)), float(np.max(img))
+                if img_min != img_min or img_max != img_max:
+                    img_min, img_max = float(np.nanmin(img)), float(np.nanmax(img))
+                return img_min, img_max
         except Exception:
             pass
         return None, None
@@ -14,10 +14,11 @@ from ..utils.averaging_lines import AveragingLineManager
 from ..utils import (
     add_line, add_crosshair, create_histogram, 
     initialize_spectrum_plot_item, initialize_image_plot_item,
-    set_plot_wavelength_range, reset_plot_wavelength_range, update_crosshair_from_mouse
+    set_plot_wavelength_range, reset_plot_wavelength_range, update_crosshair_from_mouse,
+    set_label_text, map_scene_to_view
 )
-from ..utils.plotting import SOLID_LINE
-from ..models import PlotDataModel, AxisConfigs
+from ..utils.plotting import SOLID_LINE, line_pen
+from ..models import PlotDataModel, AxisConfigs, mean_along_axis
 
 class StokesSpatialWindow(BasePlotWidget):
     
@@ -32,7 +33,7 @@ class StokesSpatialWindow(BasePlotWidget):
         # Use data model for axis handling
         if config is None:
             config = AxisConfigs.spatial_window()  # Default for spectator_viewer
-        self.data_model = PlotDataModel(data, config)
+        self.data_model = PlotDataModel(data, config, force_contiguous=True)
         
         # Initialize current index
         self.current_wl_idx = self.data_model.get_dimension_size(0) // 2
@@ -48,7 +49,7 @@ class StokesSpatialWindow(BasePlotWidget):
         self.plotItem.addItem(self.plot_curve)
         
         colors = getWidgetColors()
-        self.plot_curve_avg = pg.PlotDataItem(pen=pg.mkPen(colors.get('averaging_v', 'yellow'), style=SOLID_LINE, width=2)) 
+        self.plot_curve_avg = pg.PlotDataItem(pen=line_pen(colors.get('averaging_v', 'yellow'), 2, SOLID_LINE)) 
         self.plotItem.addItem(self.plot_curve_avg)
 
         colors = getWidgetColors()
@@ -86,13 +87,17 @@ class StokesSpatialWindow(BasePlotWidget):
         initial_x = (x_indices[0] + x_indices[-1]) / 2 if x_indices.size > 1 else (x_indices[0] if x_indices.size > 0 else 0)
         self.update_x_line(initial_x) 
 
-    def _update_label(self):
-        """Updates the coordinate label."""
+    def _update_label(self, spatial_pos: Optional[float] = None):
+        """Updates the coordinate label.
+
+        Args:
+            spatial_pos: Current hLine position, if already read by the caller.
+        """
         # Get the spatial position from the horizontal line
-        spatial_pos = self.hLine.value()
+        if spatial_pos is None:
+            spatial_pos = self.hLine.value()
         # Find the closest spatial index
-        x_indices = self.data_model.get_index_array(1)
-        spatial_idx = np.argmin(np.abs(x_indices - spatial_pos)) if x_indices.size > 0 else 0
+        spatial_idx = max(self.data_model.nearest_index(1, spatial_pos), 0)
         
         # Get the z value (intensity) at the current position
         intensity_value = np.nan
@@ -107,8 +112,8 @@ class StokesSpatialWindow(BasePlotWidget):
         """Handles internal hLine movement and emits signal."""
         current_y = self.hLine.value()
         self.xChanged.emit(current_y)
-        self._update_label()  # Update regular label
-        self._update_label_wl_avg()  # Update averaged label
+        self._update_label(current_y)  # Update regular label
+        self._update_label_wl_avg(current_y)  # Update averaged label
 
     @QtCore.pyqtSlot(float)
     def update_x_line(self, y: float):
@@ -141,16 +146,16 @@ class StokesSpatialWindow(BasePlotWidget):
             """Updates the plotted spectrum data based on a new spatial indices of averaging regions."""
 
             self.current_wl_idx_avg = wl_idx_c
-            self.plot_data_avg = self.data_model.get_averaged_slice(0, wl_idx_l, wl_idx_h)
+            self.plot_data_avg = self.data_model.get_averaged_slice(0, wl_idx_l, wl_idx_h, reuse_buffer=True)
             x_coords, y_coords = self.data_model.get_plot_data(self.plot_data_avg)
             self.plot_curve_avg.setData(x_coords, y_coords)
             self._update_label_wl_avg()     
             
+    @QtCore.pyqtSlot()
     def clear_averaging_regions(self):
         """Clear all spatial averaging regions and reset to clean state."""
         # Remove averaged data
-        if hasattr(self, 'plot_data_avg'):
-            delattr(self, 'plot_data_avg')
+        self.plot_data_avg = None
         if hasattr(self, 'current_wl_idx_avg'):
             delattr(self, 'current_wl_idx_avg')
             
@@ -160,19 +165,19 @@ class StokesSpatialWindow(BasePlotWidget):
         # Clear the label
         self.label_avg.setText("")
     
-    def _update_label_wl_avg(self):
+    def _update_label_wl_avg(self, spatial_pos: Optional[float] = None):
                 """Updates the coordinate label for averaged region."""
                 # Get the spatial position from the horizontal line
-                spatial_pos = self.hLine.value()
+                if spatial_pos is None:
+                    spatial_pos = self.hLine.value()
                 # Find the closest spatial index
-                x_indices = self.data_model.get_index_array(1)
-                spatial_idx = np.argmin(np.abs(x_indices - spatial_pos)) if x_indices.size > 0 else 0
+                spatial_idx = max(self.data_model.nearest_index(1, spatial_pos), 0)
                 
                 # Get the z value (intensity) at the intersection of yellow line and white horizontal line
-                has_avg_data = hasattr(self, 'plot_data_avg') and isinstance(self.plot_data_avg, np.ndarray)
+                has_avg_data = isinstance(self.plot_data_avg, np.ndarray)
                 if has_avg_data and spatial_idx < len(self.plot_data_avg):
                     z_value = self.plot_data_avg[spatial_idx]
-                    self.label_avg.setText(f"z= {z_value:.3f}")
+                    set_label_text(self.label_avg, f"z= {z_value:.3f}")
                 else:
                     # Hide the label when no averaging region is defined
                     self.label_avg.setText("")
@@ -192,11 +197,13 @@ class StokesSpatialWindow(BasePlotWidget):
         # Update spatial data with spectral averaging
         self.update_spatial_data_wl_avg(x_idx_low, x_idx_center, x_idx_high)
 
+    @QtCore.pyqtSlot(float, float)
     def update_spatial_range(self, min_val, max_val):
         """Updates the spatial (x pixel) axis range of the spatial plot (x-axis)."""
         x_indices = self.data_model.get_index_array(1)
         set_plot_wavelength_range(self.plotItem, x_indices, min_val, max_val, axis='x')
 
+    @QtCore.pyqtSlot()
     def reset_spatial_range(self):
         """Resets the spatial (x pixel) axis range to full range on the spatial plot (x-axis)."""
         x_indices = self.data_model.get_index_array(1)
@@ -209,14 +216,12 @@ class StokesSpatialWindow(BasePlotWidget):
         except Exception:
             pass
     
-    @QtCore.pyqtSlot(float)
     @QtCore.pyqtSlot(float, float, int)
     def update_from_spectrum_crosshair(self, xpos_wl: float, ypos_spatial_x: float, source_stokes_index: int):
         """Update spatial window based on crosshair movement in spectrum image."""
         # Update horizontal line position to match spectrum image crosshair
-        self.hLine.blockSignals(True)  # Prevent feedback loop
-        self.hLine.setPos(ypos_spatial_x)
-        self.hLine.blockSignals(False)
+        with QtCore.QSignalBlocker(self.hLine):  # Prevent feedback loop
+            self.hLine.setPos(ypos_spatial_x)
         
         # Update spatial data slice based on vertical line (spectral) position
         spectral_idx = self.data_model.validate_index(0, int(np.round(xpos_wl)))
@@ -230,6 +235,7 @@ class StokesSpatialWindow(BasePlotWidget):
         """Clear the fixed X-axis range."""
         self._fixed_x_range = None
 
+    @QtCore.pyqtSlot(int)
     def update_spatial_data_spectral(self, spectral_idx: int):
         """Update spatial data based on spectral index."""
         # Validate and clamp index
@@ -279,13 +285,17 @@ class StokesSpectrumWindow(BasePlotWidget):
 
         self.name = name + " spectrum"
         
-        # Use data model for axis handling
+        # Use data model for axis handling; spectra are columns of (spectral, x)
+        # data, so keep a column-ordered mirror for the crosshair updates
         config = AxisConfigs.spectrum_window()
-        self.data_model = PlotDataModel(data, config)
+        self.data_model = PlotDataModel(data, config, column_mirror=True, force_contiguous=True)
         
         # Initialize current index
         self.current_x_idx = self.data_model.get_dimension_size(1) // 2
 
+        # Spatial_y averaged spectrum; None while no spatial_y averaging region is set
+        self.plot_data_spatial_y_avg = None
+
         self._setup_plot_items()
         self._setup_connections()
         self._initialize_plot_state()
@@ -297,10 +307,10 @@ class StokesSpectrumWindow(BasePlotWidget):
         self.plotItem.addItem(self.plot_curve)
         
         colors = getWidgetColors()
-        self.plot_curve_spectral_avg = pg.PlotDataItem(pen=pg.mkPen(colors.get('averaging_spatial_x', 'dodgerblue'), style=SOLID_LINE, width=2)) 
+        self.plot_curve_spectral_avg = pg.PlotDataItem(pen=line_pen(colors.get('averaging_spatial_x', 'dodgerblue'), 2, SOLID_LINE)) 
         self.plotItem.addItem(self.plot_curve_spectral_avg)
 
-        self.plot_curve_spatial_y_avg = pg.PlotDataItem(pen=pg.mkPen(colors.get('averaging_spatial_y', '#2ecc71'), style=SOLID_LINE, width=2))
+        self.plot_curve_spatial_y_avg = pg.PlotDataItem(pen=line_pen(colors.get('averaging_spatial_y', '#2ecc71'), 2, SOLID_LINE))
         self.plotItem.addItem(self.plot_curve_spatial_y_avg)
 
         colors = getWidgetColors()
@@ -337,47 +347,54 @@ class StokesSpectrumWindow(BasePlotWidget):
         initial_spectral = (spectral_indices[0] + spectral_indices[-1]) / 2 if spectral_indices.size > 1 else (spectral_indices[0] if spectral_indices.size > 0 else 0)
         self.update_spectral_line(initial_spectral) 
 
-    def _update_label(self):
-        """Updates the coordinate label."""
-        spectral_value = self.vLine.value()
+    def _update_label(self, spectral_value: Optional[float] = None):
+        """Updates the coordinate label.
+
+        Args:
+            spectral_value: Current vLine position, if already read by the caller.
+        """
+        if spectral_value is None:
+            spectral_value = self.vLine.value()
         # Find the closest index to the current spectral value
-        spectral_indices = self.data_model.get_index_array(0)
-        spectral_idx = np.argmin(np.abs(spectral_indices - spectral_value)) if spectral_indices.size > 0 else -1
+        spectral_idx = self.data_model.nearest_index(0, spectral_value)
         intensity_value = np.nan
         if isinstance(self.plot_data, np.ndarray) and self.plot_data.ndim == 1 and 0 <= spectral_idx < self.plot_data.size:
             intensity_value = self.plot_data[spectral_idx]
 
         self.label.setText(f"λ: {spectral_value:.0f}, z: {intensity_value:.5f}", size=DEFAULT_LABEL_SIZE)
         
-    def _update_label_x_avg(self):
+    def _update_label_x_avg(self, wl_value: Optional[float] = None):
         """Updates the coordinate label for averaged region."""
         # Use the white line position to pick the averaged z value, but only show z=
-        wl_value = self.vLine.value() if hasattr(self, 'vLine') and self.vLine else self.current_x_idx_avg
-        spectral_indices = self.data_model.get_index_array(0)
-        wl_idx = np.argmin(np.abs(spectral_indices - wl_value)) if spectral_indices.size > 0 else -1
+        if wl_value is None:
+            wl_value = self.vLine.value() if hasattr(self, 'vLine') and self.vLine else self.current_x_idx_avg
+        wl_idx = self.data_model.nearest_index(0, wl_value)
         intensity_value = np.nan
         if isinstance(self.plot_data_avg, np.ndarray) and self.plot_data_avg.ndim == 1 and 0 <= wl_idx < self.plot_data_avg.size:
             intensity_value = self.plot_data_avg[wl_idx]
 
         # Match spatial window convention: only show z=
-        self.label_avg.setText(f"z= {intensity_value:.3f}")
+        set_label_text(self.label_avg, f"z= {intensity_value:.3f}")
 
     def _on_vline_moved(self):
         """Handles internal vLine movement and emits signal."""
+        # Read the line position once per drag event and share it with the labels
         current_wl = self.vLine.value()
         self.spectralChanged.emit(current_wl)
-        self._update_label()
+        self._update_label(current_wl)
         # Also update spatial averaging label if it exists
-        if hasattr(self, 'plot_data_avg') and hasattr(self, 'current_x_idx_avg'):
-            self._update_label_x_avg()
-        if hasattr(self, 'plot_data_spatial_y_avg'):
-            self._update_label_spatial_y_avg()
+        if self.plot_data_avg is not None:
+            self._update_label_x_avg(current_wl)
+        if self.plot_data_spatial_y_avg is not None:
+            self._update_label_spatial_y_avg(current_wl)
 
+    @QtCore.pyqtSlot(float, float)
     def update_spectral_range(self, min_val: Optional[float], max_val: Optional[float]):
         """Updates the spectral-axis range of the spectrum plot."""
         spectral_indices = self.data_model.get_index_array(0)
         set_plot_wavelength_range(self.plotItem, spectral_indices, min_val, max_val, axis='x')
     
+    @QtCore.pyqtSlot()
     def reset_spectral_range(self):
         """Resets the spectral-axis range to the initial maximum range."""
         spectral_indices = self.data_model.get_index_array(0)
@@ -401,7 +418,7 @@ class StokesSpectrumWindow(BasePlotWidget):
             # Update the vertical line position if it exists
             if not np.isclose(self.vLine.value(), spectral_position):
                 self.vLine.setValue(spectral_position)
-                self._update_label()
+                self._update_label(spectral_position)
         except AttributeError:
             print("Warning: update_spectral_line called before vLine was initialized.")
 
@@ -429,20 +446,20 @@ class StokesSpectrumWindow(BasePlotWidget):
     def update_spectrum_data_x_avg(self, x_idx_l: int, x_idx_c: int , x_idx_h: int):
         """Updates the plotted spectrum data based on a new spatial indices of averaging regions."""
         self.current_x_idx_avg = x_idx_c
-        self.plot_data_avg = self.data_model.get_averaged_slice(1, x_idx_l, x_idx_h)
+        self.plot_data_avg = self.data_model.get_averaged_slice(1, x_idx_l, x_idx_h, reuse_buffer=True)
         x_coords, y_coords = self.data_model.get_plot_data(self.plot_data_avg)
         self.plot_curve_spectral_avg.setData(x_coords, y_coords)
         self._update_label_x_avg()
 
-    def _update_label_spatial_y_avg(self):
+    def _update_label_spatial_y_avg(self, wl_value: Optional[float] = None):
         """Updates the coordinate label for spatial_y averaged region."""
-        wl_value = self.vLine.value() if hasattr(self, 'vLine') and self.vLine else getattr(self, 'current_y_idx_avg', 0)
-        spectral_indices = self.data_model.get_index_array(0)
-        wl_idx = np.argmin(np.abs(spectral_indices - wl_value)) if spectral_indices.size > 0 else -1
+        if wl_value is None:
+            wl_value = self.vLine.value() if hasattr(self, 'vLine') and self.vLine else getattr(self, 'current_y_idx_avg', 0)
+        wl_idx = self.data_model.nearest_index(0, wl_value)
         intensity_value = np.nan
         if isinstance(self.plot_data_spatial_y_avg, np.ndarray) and self.plot_data_spatial_y_avg.ndim == 1 and 0 <= wl_idx < self.plot_data_spatial_y_avg.size:
             intensity_value = self.plot_data_spatial_y_avg[wl_idx]
-        self.label_avg_spatial_y.setText(f"z= {intensity_value:.3f}")
+        set_label_text(self.label_avg_spatial_y, f"z= {intensity_value:.3f}")
 
     def update_spectrum_data_y(self, y_idx: int, y_data: np.ndarray):
         """Updates the spectrum window to display data from a y-slice.
@@ -454,22 +471,16 @@ class StokesSpectrumWindow(BasePlotWidget):
         if y_data.ndim != 2:
             raise ValueError(f"update_spectrum_data_y expects 2D data (spectral, y); got shape {y_data.shape}")
         
-        # Temporarily update data model with y-slice data
-        original_data = self.data_model.data
-        self.data_model.update_data(y_data)
-        
-        # Update spectrum with the y index (treated as spatial index in the y-slice)
-        y_idx = self.data_model.validate_index(1, y_idx)
+        # Slice the y-slice data directly (y index treated as spatial index); it shares
+        # the spectral axis with the data model, so the model is left untouched
+        y_idx = int(np.clip(y_idx, 0, y_data.shape[1] - 1))
         self.current_x_idx = y_idx
-        self.plot_data = self.data_model.get_slice_at_index(1, y_idx)
+        self.plot_data = y_data[:, y_idx]
         x_coords, y_coords = self.data_model.get_plot_data(self.plot_data)
         self.plot_curve.setData(x_coords, y_coords)
         if self._fixed_y_range is not None:
             self.plotItem.setYRange(*self._fixed_y_range, padding=0)
         self._update_label()
-        
-        # Restore original data model
-        self.data_model.update_data(original_data)
 
     def update_spectrum_data_spatial_y_avg(self, y_idx_l: int, y_idx_c: int, y_idx_h: int, y_data: np.ndarray):
         """Updates the plotted spectrum data based on a spatial_y averaging region.
@@ -484,7 +495,7 @@ class StokesSpectrumWindow(BasePlotWidget):
             raise ValueError(f"update_spectrum_data_spatial_y_avg expects 2D data (spectral, y); got shape {y_data.shape}")
 
         self.current_y_idx_avg = y_idx_c
-        self.plot_data_spatial_y_avg = y_data[:, y_idx_l:y_idx_h + 1].mean(axis=1)
+        self.plot_data_spatial_y_avg = mean_along_axis(y_data[:, y_idx_l:y_idx_h + 1], 1)
 
         spectral_indices = self.data_model.get_index_array(0)
         # Ensure data aligns with current spectral indices length
@@ -515,20 +526,20 @@ class StokesSpectrumWindow(BasePlotWidget):
 
         self.update_spectrum_data_spatial_y_avg(y_idx_low, y_idx_center, y_idx_high, y_data)
 
+    @QtCore.pyqtSlot()
     def clear_spatial_y_averaging(self):
         """Clear the spatial_y averaged curve and label."""
-        if hasattr(self, 'plot_data_spatial_y_avg'):
-            delattr(self, 'plot_data_spatial_y_avg')
+        self.plot_data_spatial_y_avg = None
         if hasattr(self, 'current_y_idx_avg'):
             delattr(self, 'current_y_idx_avg')
         self.plot_curve_spatial_y_avg.setData([], [])
         self.label_avg_spatial_y.setText("")
     
+    @QtCore.pyqtSlot()
     def clear_averaging_regions(self):
         """Clear all spectrum averaging regions and reset to clean state."""
         # Remove averaged data
-        if hasattr(self, 'plot_data_avg'):
-            delattr(self, 'plot_data_avg')
+        self.plot_data_avg = None
         if hasattr(self, 'current_x_idx_avg'):
             delattr(self, 'current_x_idx_avg')
             
@@ -542,7 +553,9 @@ class StokesSpectrumWindow(BasePlotWidget):
         if data.ndim != 2:
             raise ValueError(f"StokesSpectrumWindow expects 2D data (spectral, x); got shape {data.shape}")
 
-        # Update data model
+        # Update data model; full data is swapped on every scan move, where a
+        # column mirror would cost a full copy for a single spectrum read
+        self.data_model.column_mirror = False
         self.data_model.update_data(data)
 
         # Clamp current_x_idx
@@ -581,7 +594,7 @@ class StokesSpatialYWindow(BasePlotWidget):
         self.plotItem.addItem(self.plot_curve)
 
         colors = getWidgetColors()
-        self.plot_curve_avg = pg.PlotDataItem(pen=pg.mkPen(colors.get('averaging_v', 'yellow'), style=SOLID_LINE, width=2))
+        self.plot_curve_avg = pg.PlotDataItem(pen=line_pen(colors.get('averaging_v', 'yellow'), 2, SOLID_LINE))
         self.plotItem.addItem(self.plot_curve_avg)
 
         self.hLine = add_line(self.plotItem, colors.get('draggable_line', 'white'), 0, moveable=True)
@@ -640,13 +653,13 @@ class StokesSpatialYWindow(BasePlotWidget):
         """Update the plotted y profile with spectrally averaged data."""
         if self.n_spectral == 0 or self.n_x == 0:
             return
-        self.plot_data_avg = self.full_cube[:, wl_idx_l:wl_idx_h + 1, self.current_x_idx].mean(axis=1)
+        self.plot_data_avg = mean_along_axis(self.full_cube[:, wl_idx_l:wl_idx_h + 1, self.current_x_idx], 1)
         self.plot_curve_avg.setData(self.plot_data_avg, self.y_pixels)
         self._update_label_avg()
 
     def _update_label_avg(self):
         """Update the label for the spectrally averaged y profile."""
-        if not hasattr(self, 'plot_data_avg') or not isinstance(self.plot_data_avg, np.ndarray):
+        if not isinstance(self.plot_data_avg, np.ndarray):
             self.label_avg.setText("")
             return
         y_pos = float(self.hLine.value()) if hasattr(self, 'hLine') else float(self.current_y_idx)
@@ -654,12 +667,12 @@ class StokesSpatialYWindow(BasePlotWidget):
         z = np.nan
         if 0 <= y_idx < self.plot_data_avg.size:
             z = float(self.plot_data_avg[y_idx])
-        self.label_avg.setText(f"z= {z:.3f}")
+        set_label_text(self.label_avg, f"z= {z:.3f}")
 
+    @QtCore.pyqtSlot()
     def clear_averaging_regions(self):
         """Clear spectral averaging regions and reset to clean state."""
-        if hasattr(self, 'plot_data_avg'):
-            delattr(self, 'plot_data_avg')
+        self.plot_data_avg = None
         self.plot_curve_avg.setData([], [])
         self.label_avg.setText("")
 
@@ -686,6 +699,7 @@ class StokesSpatialYWindow(BasePlotWidget):
         self.current_x_idx = int(np.clip(x_idx, 0, self.n_x - 1))
         self._refresh_profile()
 
+    @QtCore.pyqtSlot(int)
     def update_spatial_data_spectral(self, spectral_idx: int):
         """Alias to mirror StokesSpatialWindow.update_spatial_data_spectral."""
         self.update_spectral_index(int(spectral_idx))
@@ -696,13 +710,10 @@ class StokesSpatialYWindow(BasePlotWidget):
             return
         if np.isclose(self.hLine.value(), y_pos):
             return
-        self.hLine.blockSignals(True)
-        try:
+        with QtCore.QSignalBlocker(self.hLine):
             self.hLine.setPos(float(y_pos))
             self.current_y_idx = int(np.clip(np.round(y_pos), 0, self.n_y - 1)) if self.n_y > 0 else 0
             self._update_label()
-        finally:
-            self.hLine.blockSignals(False)
 
     @QtCore.pyqtSlot(float, float, int)
     def update_from_spectrum_image_crosshair(self, xpos_wl: float, ypos_spatial_x: float, source_stokes_index: int):
@@ -721,9 +732,11 @@ class StokesSpatialYWindow(BasePlotWidget):
     def update_spectral_index(self, spectral_idx: int):
         self.update_profile(int(spectral_idx), self.current_x_idx)
 
+    @QtCore.pyqtSlot(float, float)
     def update_spatial_y_range(self, min_val: Optional[float], max_val: Optional[float]):
         set_plot_wavelength_range(self.plotItem, self.y_pixels, min_val, max_val, axis='y')
 
+    @QtCore.pyqtSlot()
     def reset_spatial_y_range(self):
         reset_plot_wavelength_range(self.plotItem, self.y_pixels, axis='y')
 
@@ -743,10 +756,10 @@ class StokesSpectrumImageWindow(BasePlotWidget):
         # Use data model with axis configuration
         if config is None:
             config = AxisConfigs.spectrum_image_window_default()
-        self.data_model = PlotDataModel(data, config)
+        self.data_model = PlotDataModel(data, config, force_contiguous=True)
         
-        # Store original data for image display
-        self.data = data
+        # Store data for image display (shares the model's contiguous array)
+        self.data = self.data_model.data
         self.n_spectral = self.data_model.get_dimension_size(0)
         self.n_x_pixel = self.data_model.get_dimension_size(1) 
 
@@ -925,7 +938,7 @@ class StokesSpectrumImageWindow(BasePlotWidget):
                 return True
             elif event.type() == QtCore.QEvent.Type.GraphicsSceneMouseMove and self.right_button_pressed:
                 if self.spectral_averaging_enabled or self.spatial_averaging_enabled:
-                    current_pos = self.plotItem.vb.mapSceneToView(event.scenePos())
+                    current_pos = map_scene_to_view(self.plotItem.vb, event.scenePos())
                     if self.spectral_averaging_enabled and hasattr(self, 'spectral_manager'):
                         self.spectral_manager.update_drag_to(current_pos.x())
                     elif self.spatial_averaging_enabled and hasattr(self, 'spatial_manager'):
@@ -945,10 +958,10 @@ class StokesSpectrumImageWindow(BasePlotWidget):
         return super().eventFilter(obj, event)
 
     def _clamp_spectral_position(self, pos: float) -> float:
-        return np.clip(pos, 0, self.n_spectral - 1)
+        return min(max(pos, 0), self.n_spectral - 1)
     
     def _clamp_spatial_position(self, pos: float) -> float:
-        return np.clip(pos, 0, self.n_x_pixel - 1)
+        return min(max(pos, 0), self.n_x_pixel - 1)
 
     def _setup_axes(self):
         config = self.data_model.config
@@ -1116,6 +1129,10 @@ class StokesSpectrumImageWindow(BasePlotWidget):
                 self.last_valid_crosshair_pos = (xpos, ypos)
                 self.updateLabelFromCrosshair(xpos, ypos)
                 
+                # Sub-pixel motion leaves the connected windows unchanged
+                if not self._crosshair_pixel_changed(xpos, ypos):
+                    return
+                
                 # Emit spectral and spatial values in consistent order (spectral, spatial)
                 config = self.data_model.config
                 if config.x_data_dim == 0:  # spectral on x-axis
@@ -1143,20 +1160,23 @@ class StokesSpectrumImageWindow(BasePlotWidget):
         # Access data in original (spectral, spatial_x) order
         intensity = self.data[spectral_idx, spatial_idx]
         
-        self.label.setText(f"{config.x_label}: {xpos:.0f}, {config.y_label}: {ypos:.0f}, z: {intensity:.5f}", size=DEFAULT_LABEL_SIZE) 
+        set_label_text(self.label, f"{config.x_label}: {xpos:.0f}, {config.y_label}: {ypos:.0f}, z: {intensity:.5f}", size=DEFAULT_LABEL_SIZE) 
 
+    @QtCore.pyqtSlot(float, float)
     def update_spectral_range(self, min_val, max_val):
         config = self.data_model.config
         axis = 'x' if config.x_data_dim == 0 else 'y'
         spectral_indices = self.data_model.get_index_array(0)
         set_plot_wavelength_range(self.plotItem, spectral_indices, min_val, max_val, axis=axis) 
 
+    @QtCore.pyqtSlot()
     def reset_spectral_range(self):
         config = self.data_model.config
         axis = 'x' if config.x_data_dim == 0 else 'y'
         spectral_indices = self.data_model.get_index_array(0)
         reset_plot_wavelength_range(self.plotItem, spectral_indices, axis=axis) 
 
+    @QtCore.pyqtSlot(float, float)
     def update_spatial_range(self, min_val, max_val):
         """Updates the spatial (x pixel) axis range of the image plot."""
         config = self.data_model.config
@@ -1164,6 +1184,7 @@ class StokesSpectrumImageWindow(BasePlotWidget):
         spatial_indices = self.data_model.get_index_array(1)
         set_plot_wavelength_range(self.plotItem, spatial_indices, min_val, max_val, axis=axis)
 
+    @QtCore.pyqtSlot()
     def reset_spatial_range(self):
         """Resets the spatial (x pixel) axis range to the initial maximum range."""
         config = self.data_model.config
@@ -1231,20 +1252,14 @@ class StokesSpectrumImageWindow(BasePlotWidget):
                 xpos, ypos = spatial_pos, spectral_pos
             
             # Block signals to prevent feedback loops
-            self.vLine.blockSignals(True)
-            self.hLine.blockSignals(True)
-            
-            # Update crosshair positions
-            self.vLine.setPos(xpos)
-            self.hLine.setPos(ypos)
-            
-            # Update label and store position
-            self.last_valid_crosshair_pos = (xpos, ypos)
-            self.updateLabelFromCrosshair(xpos, ypos)
-            
-            # Re-enable signals
-            self.vLine.blockSignals(False)
-            self.hLine.blockSignals(False)
+            with QtCore.QSignalBlocker(self.vLine), QtCore.QSignalBlocker(self.hLine):
+                # Update crosshair positions
+                self.vLine.setPos(xpos)
+                self.hLine.setPos(ypos)
+                
+                # Update label and store position
+                self.last_valid_crosshair_pos = (xpos, ypos)
+                self.updateLabelFromCrosshair(xpos, ypos)
 
     def set_data(self, data: np.ndarray):
         if data.ndim != 2:
@@ -1317,28 +1332,33 @@ class StokesSpectrumImageWindow(BasePlotWidget):
             self.last_valid_crosshair_pos = (x, y)
             self.updateLabelFromCrosshair(x, y)
     
+    @QtCore.pyqtSlot()
     def clear_averaging_regions(self):
         """Clear all averaging regions and reset to clean state."""
         self._remove_final_lines()
     
+    @QtCore.pyqtSlot()
     def remove_spectral_averaging(self):
         """Remove all spectral averaging lines and clear labels."""
         self._remove_spectral_lines()
         if hasattr(self, 'label_avg_spectral'):
             self.label_avg_spectral.setText("")
     
+    @QtCore.pyqtSlot()
     def remove_spatial_averaging(self):
         """Remove all spatial averaging lines and clear labels."""
         self._remove_spatial_lines()
         if hasattr(self, 'label_avg_spatial'):
             self.label_avg_spatial.setText("")
     
+    @QtCore.pyqtSlot()
     def create_default_spectral_averaging(self):
         """Create default spectral averaging lines using the manager."""
         self.spectral_manager.create_default_lines()
         self.control_widget.activate_spectral_button()
         self.control_widget.notify_spectral_region_added()
     
+    @QtCore.pyqtSlot()
     def create_default_spatial_averaging(self):
         """Create default spatial averaging lines using the manager."""
         self.spatial_manager.create_default_lines()
@@ -1559,7 +1579,7 @@ class StokesSpectrumYImageWindow(BasePlotWidget):
         index_spectral = np.clip(int(np.round(xpos_wl)), 0, self.n_spectral - 1)
         index_y = np.clip(int(np.round(ypos_y)), 0, self.n_y_pixel - 1)
         intensity = self.data[index_spectral, index_y]
-        self.label.setText(f"l: {xpos_wl:.0f}, y: {ypos_y:.0f}, z: {intensity:.5f}", size=DEFAULT_LABEL_SIZE)
+        set_label_text(self.label, f"l: {xpos_wl:.0f}, y: {ypos_y:.0f}, z: {intensity:.5f}", size=DEFAULT_LABEL_SIZE)
 
     def _on_mouse_clicked(self, event):
         if event.double():
@@ -1588,22 +1608,19 @@ class StokesSpectrumYImageWindow(BasePlotWidget):
         """Emit the pending crosshair position after throttle delay."""
         if self._pending_crosshair_pos is not None:
             x, y = self._pending_crosshair_pos
-            self.crosshairMoved.emit(x, y, self.stokes_index)
+            # Sub-pixel motion leaves the connected windows unchanged
+            if self._crosshair_pixel_changed(x, y):
+                self.crosshairMoved.emit(x, y, self.stokes_index)
             self._pending_crosshair_pos = None
 
     @QtCore.pyqtSlot(float, float)
     def set_crosshair_position(self, xpos_wl: float, ypos_y: float):
         if self.crosshair_locked:
             return
-        self.vLine.blockSignals(True)
-        self.hLine.blockSignals(True)
-        try:
+        with QtCore.QSignalBlocker(self.vLine), QtCore.QSignalBlocker(self.hLine):
             self.vLine.setPos(xpos_wl)
             self.hLine.setPos(ypos_y)
             self._update_label(xpos_wl, ypos_y)
-        finally:
-            self.vLine.blockSignals(False)
-            self.hLine.blockSignals(False)
 
     def set_data(self, data: np.ndarray):
         if data.ndim != 2:
@@ -1662,7 +1679,7 @@ class StokesSpectrumYImageWindow(BasePlotWidget):
                 return True
             elif event.type() == QtCore.QEvent.Type.GraphicsSceneMouseMove and self.right_button_pressed:
                 if self.spectral_averaging_enabled or self.spatial_y_averaging_enabled:
-                    current_pos = self.plotItem.vb.mapSceneToView(event.scenePos())
+                    current_pos = map_scene_to_view(self.plotItem.vb, event.scenePos())
                     if self.spectral_averaging_enabled and hasattr(self, 'spectral_manager'):
                         self.spectral_manager.update_drag_to(current_pos.x())
                     elif self.spatial_y_averaging_enabled and hasattr(self, 'spatial_y_manager'):
@@ -1696,7 +1713,7 @@ class StokesSpectrumYImageWindow(BasePlotWidget):
         if not self.right_button_pressed or self.drag_start_pos is None:
             return
         self.is_dragging = True
-        current_pos = self.plotItem.vb.mapSceneToView(event.scenePos())
+        current_pos = map_scene_to_view(self.plotItem.vb, event.scenePos())
         if self.spectral_averaging_enabled and hasattr(self, 'spectral_manager'):
             self.spectral_manager.update_drag_to(current_pos.x())
         elif self.spatial_y_averaging_enabled and hasattr(self, 'spatial_y_manager'):
@@ -1720,16 +1737,19 @@ class StokesSpectrumYImageWindow(BasePlotWidget):
         self.drag_start_pos = None
         self.is_dragging = False
 
+    @QtCore.pyqtSlot()
     def create_default_spatial_y_averaging(self):
         """Create a default spatial_y averaging region."""
         if hasattr(self, 'spatial_y_manager'):
             self.spatial_y_manager.create_default_lines()
 
+    @QtCore.pyqtSlot()
     def create_default_spectral_averaging(self):
         """Create a default spectral averaging region."""
         if hasattr(self, 'spectral_manager'):
             self.spectral_manager.create_default_lines()
 
+    @QtCore.pyqtSlot()
     def remove_spatial_y_averaging(self):
         """Remove the spatial_y averaging region."""
         if hasattr(self, 'spatial_y_manager'):
@@ -1741,6 +1761,7 @@ class StokesSpectrumYImageWindow(BasePlotWidget):
                 if hasattr(self.control_widget, 'notify_spatial_y_region_removed'):
                     self.control_widget.notify_spatial_y_region_removed()
 
+    @QtCore.pyqtSlot()
     def remove_spectral_averaging(self):
         """Remove the spectral averaging region."""
         if hasattr(self, 'spectral_manager'):
@@ -1782,15 +1803,19 @@ class StokesSpectrumYImageWindow(BasePlotWidget):
         if hasattr(self, 'control_widget') and hasattr(self.control_widget, 'activate_spatial_y_button'):
             self.control_widget.activate_spatial_y_button()
 
+    @QtCore.pyqtSlot(float, float)
     def update_spectral_range(self, min_val: Optional[float], max_val: Optional[float]):
         set_plot_wavelength_range(self.plotItem, self.spectral_pixels, min_val, max_val, axis='x')
 
+    @QtCore.pyqtSlot()
     def reset_spectral_range(self):
         reset_plot_wavelength_range(self.plotItem, self.spectral_pixels, axis='x')
 
+    @QtCore.pyqtSlot(float, float)
     def update_spatial_y_range(self, min_val: Optional[float], max_val: Optional[float]):
         set_plot_wavelength_range(self.plotItem, self.y_pixels, min_val, max_val, axis='y')
 
+    @QtCore.pyqtSlot()
     def reset_spatial_y_range(self):
         reset_plot_wavelength_range(self.plotItem, self.y_pixels, axis='y')
 
@@ -1837,9 +1862,11 @@ class AverageSpectrumWindow(BasePlotWidget):
         idx = int(np.clip(np.round(self.vLine.value()), 0, self.n_spectral - 1))
         self._emit_index(idx)
 
+    @QtCore.pyqtSlot(float, float)
     def update_spectral_range(self, min_val: Optional[float], max_val: Optional[float]):
         set_plot_wavelength_range(self.plotItem, self.spectral, min_val, max_val, axis='x')
 
+    @QtCore.pyqtSlot()
     def reset_spectral_range(self):
         reset_plot_wavelength_range(self.plotItem, self.spectral, axis='x')
 
@@ -1944,7 +1971,7 @@ class StokesImageWindow(BasePlotWidget):
         xi = int(np.clip(np.round(xpos), 0, self.n_x - 1))
         yi = int(np.clip(np.round(ypos), 0, self.n_y - 1))
         z = float(self.full_data[yi, self.current_wl_idx, xi]) if self.n_y and self.n_x else np.nan
-        self.label.setText(f"x: {xpos:.0f}, y: {ypos:.0f}, z: {z:.5f}")
+        set_label_text(self.label, f"x: {xpos:.0f}, y: {ypos:.0f}, z: {z:.5f}")
 
     def _on_mouse_clicked(self, event):
         if event.double():
@@ -1971,7 +1998,9 @@ class StokesImageWindow(BasePlotWidget):
         """Emit the pending crosshair position after throttle delay."""
         if self._pending_crosshair_pos is not None:
             x, y = self._pending_crosshair_pos
-            self.crosshairMoved.emit(x, y, self.stokes_index)
+            # Sub-pixel motion leaves the connected windows unchanged
+            if self._crosshair_pixel_changed(x, y):
+                self.crosshairMoved.emit(x, y, self.stokes_index)
             self._pending_crosshair_pos = None
 
     # Public API
@@ -1990,24 +2019,23 @@ class StokesImageWindow(BasePlotWidget):
     def set_crosshair_position(self, xpos: float, ypos: float):
         if self.crosshair_locked:
             return
-        self.vLine.blockSignals(True)
-        self.hLine.blockSignals(True)
-        try:
+        with QtCore.QSignalBlocker(self.vLine), QtCore.QSignalBlocker(self.hLine):
             self.vLine.setPos(xpos)
             self.hLine.setPos(ypos)
             self._update_label(xpos, ypos)
-        finally:
-            self.vLine.blockSignals(False)
-            self.hLine.blockSignals(False)
 
+    @QtCore.pyqtSlot(float, float)
     def update_spatial_x_range(self, min_val: float, max_val: float):
         set_plot_wavelength_range(self.plotItem, self.x_pixels, min_val, max_val, axis='x')
 
+    @QtCore.pyqtSlot()
     def reset_spatial_x_range(self):
         reset_plot_wavelength_range(self.plotItem, self.x_pixels, axis='x')
 
+    @QtCore.pyqtSlot(float, float)
     def update_spatial_y_range(self, min_val: float, max_val: float):
         set_plot_wavelength_range(self.plotItem, self.y_pixels, min_val, max_val, axis='y')
 
+    @QtCore.pyqtSlot()
     def reset_spatial_y_range(self):
         reset_plot_wavelength_range(self.plotItem, self.y_pixels, axis='y')
\ No newline at end of file
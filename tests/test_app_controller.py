@@ -0,0 +1,73 @@
+"""
+Unit tests for the data rearrangement in the app controller.
+"""
+
+import numpy as np
+import pytest
+from spectator.controllers.app_controller import DataRearranger, DataScaler, _tiled_transpose_copy
+from spectator.models.axis_types import AxisType
+
+
+class TestTiledTransposeCopy:
+    """Tests for the blocked trailing-axes transpose copy."""
+
+    @pytest.mark.parametrize("shape", [(2, 1024, 512), (2, 50, 60), (3, 100, 1260)])
+    def test_matches_view(self, shape):
+        """Test that the copy equals the transposed view and is C-contiguous."""
+        data = np.random.rand(*shape).astype(np.float32)
+        view = data.transpose(0, 2, 1)
+
+        copy = _tiled_transpose_copy(view)
+
+        assert copy.flags.c_contiguous
+        assert copy.dtype == data.dtype
+        np.testing.assert_array_equal(copy, view)
+
+
+
+class TestDataRearranger:
+    """Tests for DataRearranger class."""
+
+    @pytest.mark.parametrize("shape", [(2, 1024, 512), (2, 50, 60)])
+    def test_materialize_trailing_swap(self, shape):
+        """Test that a materialized trailing-axes swap equals the transposed view."""
+        data = np.random.rand(*shape).astype(np.float32)
+        input_axes = [AxisType.STATES, AxisType.SPECTRAL, AxisType.SPATIAL_X]
+        target_axes = [AxisType.STATES, AxisType.SPATIAL_X, AxisType.SPECTRAL]
+
+        result = DataRearranger().rearrange_data(data, input_axes, target_axes, materialize=True)
+
+        assert result.flags.c_contiguous
+        np.testing.assert_array_equal(result, data.transpose(0, 2, 1))
+
+
+class TestDataScaler:
+    """Tests for DataScaler class."""
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    @pytest.mark.parametrize("axes", [
+        [AxisType.STATES, AxisType.SPATIAL_X, AxisType.SPECTRAL],
+        [AxisType.SPATIAL_Y, AxisType.SPATIAL_X, AxisType.SPECTRAL],
+    ])
+    def test_scale_transposed_view(self, dtype, axes):
+        """Test that scaling a transposed view returns C-ordered float32 and leaves the input alone."""
+        data = (np.random.rand(2, 30, 20) * 1e5).astype(dtype)
+        original = data.copy()
+        view = data.transpose(0, 2, 1)
+
+        scaler = DataScaler()
+        scaled = scaler.scale_data(view, axes)
+
+        assert scaled.dtype == np.float32
+        assert scaled.flags.c_contiguous
+        np.testing.assert_array_equal(data, original)
+        factors = scaler.get_scale_info()['factors']
+        if AxisType.STATES in axes:
+            expected = np.stack([view[k] * factors[k] for k in range(2)])
+        else:
+            expected = view * factors['global']
+        np.testing.assert_allclose(scaled, expected.astype(np.float32), rtol=1e-6)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,90 @@
+"""
+Unit tests for the file config loader.
+"""
+
+import json
+import os
+import pytest
+from spectator.utils import config
+
+
+@pytest.fixture
+def config_paths(tmp_path, monkeypatch):
+    """Point the user and repo config paths at temporary files."""
+    user_path = tmp_path / "user" / "file_config.json"
+    repo_path = tmp_path / "repo" / "file_config.json"
+    user_path.parent.mkdir()
+    repo_path.parent.mkdir()
+    monkeypatch.setattr(config, "USER_CONFIG_PATH", str(user_path))
+    monkeypatch.setattr(config, "REPO_CONFIG_PATH", str(repo_path))
+    config.invalidate_config_cache()
+    yield user_path, repo_path
+    config.invalidate_config_cache()
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+class TestLoadConfig:
+    """Tests for load_config and its cache."""
+
+    def test_defaults_without_files(self, config_paths):
+        """Test that missing config files give the defaults."""
+        assert config.load_config() == config._DEFAULTS
+
+    def test_user_config_takes_precedence(self, config_paths):
+        """Test that the user config is used over the repo config."""
+        user_path, repo_path = config_paths
+        _write(repo_path, {"must_be_in_directory": "repo", "auto_navigate_recent": True})
+        _write(user_path, {"must_be_in_directory": "user"})
+
+        cfg = config.load_config()
+
+        assert cfg["must_be_in_directory"] == "user"
+        # The repo file is not merged in when a user file exists
+        assert cfg["auto_navigate_recent"] is False
+
+    def test_rewritten_file_is_picked_up(self, config_paths):
+        """Test that changes to a config file are seen by the next call."""
+        _, repo_path = config_paths
+        _write(repo_path, {"must_be_in_directory": "first"})
+        assert config.load_config()["must_be_in_directory"] == "first"
+
+        _write(repo_path, {"must_be_in_directory": "second run"})
+        assert config.load_config()["must_be_in_directory"] == "second run"
+
+        # Same size rewrite: detected through the modification time
+        stat = os.stat(repo_path)
+        _write(repo_path, {"must_be_in_directory": "third run!"})
+        os.utime(repo_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert config.load_config()["must_be_in_directory"] == "third run!"
+
+    def test_invalidate_config_cache(self, config_paths):
+        """Test that invalidation re-reads a file whose stamp did not change."""
+        _, repo_path = config_paths
+        _write(repo_path, {"must_be_in_directory": "aaaa"})
+        stat = os.stat(repo_path)
+        assert config.load_config()["must_be_in_directory"] == "aaaa"
+
+        _write(repo_path, {"must_be_in_directory": "bbbb"})
+        os.utime(repo_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert config.load_config()["must_be_in_directory"] == "aaaa"
+
+        config.invalidate_config_cache()
+        assert config.load_config()["must_be_in_directory"] == "bbbb"
+
+    def test_returned_config_is_a_copy(self, config_paths):
+        """Test that mutating the returned dict does not leak into the cache."""
+        cfg = config.load_config()
+        cfg["must_be_in_directory"] = "changed"
+        cfg["excluded_file_terms"].append("extra")
+
+        fresh = config.load_config()
+
+        assert fresh["must_be_in_directory"] == config._DEFAULTS["must_be_in_directory"]
+        assert fresh["excluded_file_terms"] == config._DEFAULTS["excluded_file_terms"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,31 @@
+"""
+Unit tests for datReader.
+"""
+
+import pytest
+from spectator.models.file_model import datReader
+
+
+class TestDatReader:
+    """Tests for datReader class."""
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises instead of reading as empty."""
+        reader = datReader(str(tmp_path / "missing.dat"))
+        with pytest.raises(FileNotFoundError):
+            reader.getDatImagesStacked()
+        # The failure is not cached as an empty result
+        with pytest.raises(FileNotFoundError):
+            reader.getStateNames()
+
+    def test_corrupt_file_raises(self, tmp_path):
+        """Test that a file that is not an IDL save file raises."""
+        path = tmp_path / "corrupt.dat"
+        path.write_bytes(b"not an idl save file")
+        reader = datReader(str(path))
+        with pytest.raises(Exception):
+            reader.getDatImagesStacked()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
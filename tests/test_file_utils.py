@@ -0,0 +1,69 @@
+"""
+Unit tests for the file system utilities.
+"""
+
+import os
+import pytest
+from spectator.utils.file_utils import walk_files
+
+
+def _filtered_walk(top, suffix):
+    """Reference result: os.walk filtered by suffix, skipping directories without matches."""
+    result = []
+    for directory, _, files in os.walk(top):
+        matches = [name for name in files if name.endswith(suffix)]
+        if matches:
+            result.append((directory, matches))
+    return result
+
+
+class TestWalkFiles:
+    """Tests for walk_files."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Directory tree with nested, empty, symlinked and unreadable directories."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "c").mkdir()
+        (tmp_path / "empty").mkdir()
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "target").mkdir()
+        for path in ["top.dat", "notes.txt", "a/one.dat", "a/b/two.dat", "a/b/two.txt",
+                     "c/three.dat", "locked/hidden.dat", "target/linked.dat"]:
+            (tmp_path / path).write_text("x")
+        # Symlinked directory (not followed) and symlinked file (listed)
+        os.symlink(tmp_path / "target", tmp_path / "c" / "link_dir")
+        os.symlink(tmp_path / "top.dat", tmp_path / "c" / "link_file.dat")
+        os.chmod(tmp_path / "locked", 0)
+        yield tmp_path
+        os.chmod(tmp_path / "locked", 0o755)
+
+    def test_matches_filtered_os_walk(self, tree, monkeypatch):
+        """Test that walk_files yields the same directories and files as filtered os.walk."""
+        locked = str(tree / "locked")
+        scandir = os.scandir
+
+        def scandir_denying_locked(path):
+            # chmod does not stop root, so also deny the directory explicitly
+            if os.fspath(path) == locked:
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        # os.walk looks scandir up in the os module, so both walks see the error
+        monkeypatch.setattr(os, "scandir", scandir_denying_locked)
+
+        result = list(walk_files(str(tree), ".dat"))
+
+        assert result == _filtered_walk(str(tree), ".dat")
+        directories = [directory for directory, _ in result]
+        assert locked not in directories
+        assert str(tree / "c" / "link_dir") not in directories
+        assert sorted(dict(result)[str(tree / "c")]) == ["link_file.dat", "three.dat"]
+
+    def test_missing_top(self, tmp_path):
+        """Test that a missing start directory yields nothing."""
+        assert list(walk_files(str(tmp_path / "missing"), ".dat")) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -108,6 +108,102 @@ class TestPlotDataModel:
         
         np.testing.assert_array_equal(avg1, avg2)
     
+    def test_get_averaged_slice_float(self):
+        """Test averaged slicing of floating point data along each dimension."""
+        data = np.random.rand(10, 6).astype(np.float32)
+        config = AxisConfigs.spatial_window()
+        model = PlotDataModel(data, config)
+        
+        avg_dim0 = model.get_averaged_slice(0, 2, 4)
+        avg_dim1 = model.get_averaged_slice(1, 1, 3)
+        
+        assert avg_dim0.dtype == np.float32
+        np.testing.assert_allclose(avg_dim0, data[2:5, :].mean(axis=0), rtol=1e-5)
+        np.testing.assert_allclose(avg_dim1, data[:, 1:4].mean(axis=1), rtol=1e-5)
+    
+    def test_get_averaged_slice_full_range_cached(self):
+        """Test that full-range averages are reused until the data changes."""
+        data = np.random.rand(10, 6)
+        config = AxisConfigs.spatial_window()
+        model = PlotDataModel(data, config)
+        
+        first = model.get_averaged_slice(0, 0, 9)
+        assert model.get_averaged_slice(0, 9, 0) is first
+        np.testing.assert_allclose(first, data.mean(axis=0))
+        
+        new_data = data + 1.0
+        model.update_data(new_data)
+        np.testing.assert_allclose(model.get_averaged_slice(0, 0, 9), new_data.mean(axis=0))
+
+    def test_get_averaged_slice_reuse_buffer(self):
+        """Test that region averages can be written into a reused array."""
+        data = np.random.rand(10, 6).astype(np.float32)
+        config = AxisConfigs.spatial_window()
+        model = PlotDataModel(data, config)
+
+        first = model.get_averaged_slice(1, 1, 3, reuse_buffer=True)
+        np.testing.assert_allclose(first, data[:, 1:4].mean(axis=1), rtol=1e-5)
+        second = model.get_averaged_slice(1, 2, 5, reuse_buffer=True)
+        assert second is first
+        np.testing.assert_allclose(second, data[:, 2:6].mean(axis=1), rtol=1e-5)
+
+        model.update_data(np.random.rand(12, 6))
+        third = model.get_averaged_slice(1, 0, 2, reuse_buffer=True)
+        assert third is not first and third.shape == (12,)
+
+    def test_get_averaged_slice_reuse_buffer_big_endian(self):
+        """Test reused-buffer averages of non-native byte order data."""
+        data = np.random.rand(10, 6).astype('>f4')
+        config = AxisConfigs.spatial_window()
+        model = PlotDataModel(data, config)
+
+        for dim, (start, end) in ((0, (2, 4)), (1, (1, 3))):
+            avg = model.get_averaged_slice(dim, start, end, reuse_buffer=True)
+            assert avg.dtype.isnative
+            expected = data[start:end + 1, :].mean(axis=0) if dim == 0 else data[:, start:end + 1].mean(axis=1)
+            np.testing.assert_allclose(avg, expected, rtol=1e-5)
+
+    def test_force_contiguous(self):
+        """Test that transposed input is copied to C order only when requested."""
+        data = np.arange(60, dtype=np.float32).reshape(6, 10).T
+        config = AxisConfigs.spatial_window()
+        
+        assert PlotDataModel(data, config).data is data
+        
+        model = PlotDataModel(data, config, force_contiguous=True)
+        assert model.data.flags.c_contiguous
+        np.testing.assert_array_equal(model.data, data)
+    
+    def test_column_mirror(self):
+        """Test that column slices from the Fortran mirror match the data."""
+        data = np.arange(60, dtype=np.float32).reshape(10, 6)
+        config = AxisConfigs.spectrum_window()
+        model = PlotDataModel(data, config, column_mirror=True)
+        
+        column = model.get_slice_at_index(1, 4)
+        assert column.flags.c_contiguous
+        np.testing.assert_array_equal(column, data[:, 4])
+        
+        # Mirror follows data updates
+        new_data = data * 2
+        model.update_data(new_data)
+        np.testing.assert_array_equal(model.get_slice_at_index(1, 4), new_data[:, 4])
+    
+    def test_nearest_index(self):
+        """Test nearest index lookup, including ties and out-of-range values."""
+        data = np.zeros((10, 6))
+        config = AxisConfigs.spatial_window()
+        model = PlotDataModel(data, config)
+        
+        for value in [-3.0, 0.0, 2.4, 2.5, 2.6, 5.0, 8.5, 42.0]:
+            indices = model.get_index_array(0)
+            expected = int(np.argmin(np.abs(indices - value)))
+            assert model.nearest_index(0, value) == expected
+        
+        # Empty dimension
+        empty_model = PlotDataModel(np.zeros((0, 6)), config)
+        assert empty_model.nearest_index(0, 1.0) == -1
+    
     def test_validate_index(self):
         """Test index validation and clamping."""
         data = np.zeros((10, 6))